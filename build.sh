@@ -121,7 +121,6 @@ ASSETS_DIR="$SCRIPT_DIR/catalog"
                 --paths "$SCRIPT_DIR/src" \
                 --add-data "${ASSETS_DIR}${PYINSTALLER_SEPARATOR}catalog" \
                 --collect-all rich \
-                --collect-all rich_click \
                 --collect-all ruamel.yaml \
                 --hidden-import argcomplete \
                 --hidden-import ruamel.yaml \
@@ -1,13 +1,129 @@
 # src/kubecuro/cli/formatter.py
 import difflib
+import functools
+import itertools
+import sys
+from typing import Sequence, Tuple
+from rich.cells import cell_len
 from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.table import Table
+from kubecuro.core.models import AuditReport
 
 # Initialize the Rich console for high-quality terminal output
 console = Console()
 
+# Row styling keyed by (success, partial_heal): (color, result icon)
+STATUS_STYLES = {
+    (True, False): (sys.intern("green"), "✅"),
+    (False, True): (sys.intern("yellow"), "⚠️"),
+    (False, False): (sys.intern("red"), "❌"),
+}
+
+# Pre-built markup tags per color for statuses outside the known set
+STATUS_TAGS = {color: (f"[{color}]", f"[/{color}]") for color, _ in STATUS_STYLES.values()}
+
+# Every status label the engine emits (see AuditEngineV3._derive_status)
+KNOWN_STATUSES = (
+    "UNCHANGED", "PREVIEW", "HEALED", "PARTIAL", "FAILED",
+    "ENGINE_ERROR", "FILE_NOT_FOUND", "FILE_TOO_LARGE", "NOT_K8S",
+)
+
+# (color, status) -> finished markup; a handful of entries covers every row
+_STATUS_MARKUP = {
+    (color, status): sys.intern(f"{open_tag}{status}{close_tag}")
+    for color, (open_tag, close_tag) in STATUS_TAGS.items()
+    for status in KNOWN_STATUSES
+}
+
+def status_markup(color: str, status: str) -> str:
+    """Wraps a status label in the Rich markup tags of its row color."""
+    markup = _STATUS_MARKUP.get((color, status))
+    if markup is None:
+        open_tag, close_tag = STATUS_TAGS[color]
+        markup = "".join((open_tag, status, close_tag))
+    return markup
+
+def format_status(report: AuditReport) -> Tuple[str, str]:
+    """
+    Resolves the (color, icon) pair for a report row. A successful
+    report wins over its partial flag, matching the table semantics.
+    """
+    success = bool(report.success)
+    return STATUS_STYLES[(success, not success and bool(report.partial_heal))]
+
+# Batches larger than TABLE_ROW_LIMIT only show their first TABLE_PREVIEW_ROWS rows
+TABLE_ROW_LIMIT = 500
+TABLE_PREVIEW_ROWS = 100
+
+def table_rows(reports: Sequence[AuditReport], full: bool = False) -> Sequence[AuditReport]:
+    """The rows to draw: everything, or a preview once a batch is very large."""
+    if full or len(reports) <= TABLE_ROW_LIMIT:
+        return reports
+    return reports[:TABLE_PREVIEW_ROWS]
+
+# Result column width plus padding and border characters of a 4-column table
+_TABLE_CHROME = 6 + 4 * 2 + 5
+
+def report_column_widths(rows: Sequence[AuditReport], headers: Tuple[str, str, str],
+                         max_width: int) -> Tuple[int, int, int]:
+    """
+    Path/Kind/Status column widths from one pass over the rows. Fixed
+    widths let Rich lay out the table without re-measuring every cell;
+    the path column absorbs any overflow and wraps within max_width.
+    """
+    path_w, kind_w, status_w = (cell_len(h) for h in headers)
+    for r in rows:
+        path_w = max(path_w, cell_len(r.file_path))
+        kind_w = max(kind_w, cell_len(r.kind))
+        status_w = max(status_w, len(r.status))
+    path_budget = max(cell_len(headers[0]), max_width - _TABLE_CHROME - kind_w - status_w)
+    return min(path_w, path_budget), kind_w, status_w
+
+# Manifests longer than this are shown hunk-by-hunk instead of in full
+DIFF_COLLAPSE_LINES = 500
+
+@functools.lru_cache(maxsize=256)
+def yaml_syntax(text: str, theme: str, start_line: int = 1) -> Syntax:
+    """
+    Memoized YAML Syntax renderable. Templated manifests repeat the
+    same blocks across files, so identical text is only lexed once.
+    """
+    return Syntax(text, "yaml", theme=theme, line_numbers=True, start_line=start_line)
+
+def side_by_side_table(file_path: str, old_content: str, new_content: str, context: int = 3) -> Table:
+    """
+    Builds the ORIGINAL | HEALED comparison grid. Short manifests are
+    shown whole; long ones only as changed hunks with `context` lines
+    around each, so highlighting work scales with the change size.
+    """
+    old_text, new_text = old_content.strip(), new_content.strip()
+    old_lines, new_lines = old_text.splitlines(), new_text.splitlines()
+
+    if max(len(old_lines), len(new_lines)) <= DIFF_COLLAPSE_LINES:
+        blocks = [(old_text, 1, new_text, 1, None)]
+    else:
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+        blocks = []
+        for group in matcher.get_grouped_opcodes(context):
+            i1, i2, j1, j2 = group[0][1], group[-1][2], group[0][3], group[-1][4]
+            blocks.append(("\n".join(old_lines[i1:i2]), i1 + 1,
+                           "\n".join(new_lines[j1:j2]), j1 + 1,
+                           f"[dim]lines {i1 + 1}-{i2} → {j1 + 1}-{j2}[/dim]"))
+
+    layout_table = Table.grid(expand=True, padding=1)
+    layout_table.add_column(ratio=1)
+    layout_table.add_column(ratio=1)
+    for old_block, old_start, new_block, new_start, hunk in blocks:
+        layout_table.add_row(
+            Panel(yaml_syntax(old_block, "ansi_dark", old_start), subtitle=hunk,
+                  title=f"[bold red]ORIGINAL: {file_path}[/bold red]", border_style="red"),
+            Panel(yaml_syntax(new_block, "monokai", new_start), subtitle=hunk,
+                  title=f"[bold green]HEALED: {file_path}[/bold green]", border_style="green")
+        )
+    return layout_table
+
 class KubeFormatter:
     """
     KubeFormatter: The visual heart of the CLI.
@@ -23,6 +139,11 @@ class KubeFormatter:
         if not healed_text or not original_text:
             return
 
+        # Identical text cannot produce hunks; skip the SequenceMatcher run
+        if original_text == healed_text:
+            console.print(f"[dim]ℹ No structural or logical changes needed for {file_name}.[/dim]")
+            return
+
         # Generate a Unified Diff (standard format for line changes)
         diff = difflib.unified_diff(
             original_text.splitlines(),
@@ -32,14 +153,15 @@ class KubeFormatter:
             lineterm=""
         )
 
-        diff_list = list(diff)
+        # Peek one line to detect "no changes" without buffering the whole diff
+        first_line = next(diff, None)
         
-        if not diff_list:
+        if first_line is None:
             console.print(f"[dim]ℹ No structural or logical changes needed for {file_name}.[/dim]")
             return
 
-        # Combine diff lines and wrap in a Rich Panel for clear UI separation
-        diff_output = "\n".join(diff_list)
+        # Join straight from the generator and wrap in a Rich Panel for clear UI separation
+        diff_output = "\n".join(itertools.chain((first_line,), diff))
         syntax = Syntax(diff_output, "diff", theme="monokai", line_numbers=True)
         
         console.print(Panel(
@@ -72,13 +194,9 @@ class KubeFormatter:
         table.add_column("Result", justify="center")
 
         for r in reports:
-            # Choose icons based on success
-            result_icon = "✅" if r.get("success") else "❌"
-            table.add_row(
-                r.get("file_path"),
-                r.get("kind"),
-                r.get("status"),
-                result_icon
-            )
+            if not isinstance(r, AuditReport):
+                r = AuditReport.from_result(r)
+            _, result_icon = format_status(r)
+            table.add_row(r.file_path, r.kind, r.status, result_icon)
         
         console.print(table)
@@ -12,58 +12,86 @@ Date: 2026-01-16
 
 import sys
 import os
+import functools
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Set
 
 import click
-import rich_click as rich_click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
-from rich.syntax import Syntax
-from rich import box
 
-# Core Engine Import
-from kubecuro.core.engine import AuditEngineV3
+# Lightweight discovery helper; Rich and the engine are imported on demand
+# so that `--help` and `--version` never pay for them.
+from kubecuro.core.filesystem import find_catalog, is_forbidden_root, iter_yaml_files
+from kubecuro.core.models import AuditReport
 
 # --- UI & GLOBAL CONFIGURATION ---
-console = Console()
+@functools.lru_cache(maxsize=1)
+def _console():
+    """
+    Builds the shared Rich console on first use.
+    """
+    from rich.console import Console
+    return Console()
+
+def _bake_banner() -> str:
+    """
+    Pre-renders the startup banner as plain ANSI text, matching the
+    former Rich panel (blue border, cyan title, dim italic tagline).
+    """
+    lines = [
+        ("\x1b[1;36m", "Kubernetes Logic Diagnostics & YAML Auto-Healer"),
+        ("\x1b[2;3m", "Fix broken K8s manifests instantly"),
+    ]
+    width = max(len(text) for _, text in lines)
+    border, reset = "\x1b[34m", "\x1b[0m"
+    rows = [f"{border}╭{'─' * (width + 2)}╮{reset}"]
+    rows += [f"{border}│{reset} {style}{text}{reset}{' ' * (width - len(text))} {border}│{reset}"
+             for style, text in lines]
+    rows.append(f"{border}╰{'─' * (width + 2)}╯{reset}")
+    return "\n".join(["", "\x1b[1;33m🚀 KubeCuro v1.0.0 starting...\x1b[0m", *rows])
+
+_HEADER = _bake_banner()
+
+# Command overview shown on a bare `kubecuro` call
+_COMMANDS_HELP = (
+    "\n\x1b[1;36mCOMMANDS:\x1b[0m\n"
+    "  scan    Audit manifests for issues\n"
+    "  fix     Apply logical healing and fix manifest errors\n"
+    "\n\x1b[1;36mGLOBAL OPTIONS:\x1b[0m\n"
+    "  -q, --quiet     Hide banner for scripts/automation\n"
+    "  -v, --version   Print version information\n"
+    "  -h, --help      Show this help\n"
+    "\n\x1b[1;35m💡 TIP:\x1b[0m Run \x1b[36mkubecuro scan/fix --help\x1b[0m for options"
+)
 
-rich_click.USE_RICH_MARKUP = True
-rich_click.STYLE_HELPTEXT = "italic dim"
-rich_click.MAX_WIDTH = 100 
-rich_click.SHOW_ARGUMENTS = True
-rich_click.GROUP_ARGUMENTS_OPTIONS = True
+def _use_color() -> Optional[bool]:
+    """NO_COLOR forces plain output; otherwise click decides per stream."""
+    return False if os.environ.get("NO_COLOR") else None
 
 def print_header():
     """
     Displays the application banner only on an empty CLI call.
+    Written as pre-baked ANSI so the banner path never imports Rich.
     """
-    console.print("")
-    console.print("🚀 KubeCuro v1.0.0 starting...", style="bold yellow")
-    banner_content = (
-        "[bold cyan]Kubernetes Logic Diagnostics & YAML Auto-Healer[/bold cyan]\n"
-        "[dim italic]Fix broken K8s manifests instantly[/dim italic]"
-    )
-    console.print(Panel(banner_content, border_style="blue", expand=False))
+    click.echo(_HEADER, color=_use_color())
 
 def show_shield_logs(logs: List[str]):
     """
     Renders Logic Shield policy engine logs with distinct iconography.
     """
+    console = _console()
     for log in logs:
         console.print(f"🛡️  [bold cyan]SHIELD POLICY:[/bold cyan] [white]{log}[/white]")
 
-def show_git_warnings(warnings: List[str]):
+def show_git_warnings(warnings: Iterable[str]):
     """
     Renders Git configuration warnings if KubeCuro artifacts are not ignored.
     """
     if not warnings:
         return
     
-    unique_warnings = sorted(list(set(warnings)))
-    warning_content = "\n".join([f"• [bold yellow]{w}[/bold yellow]" for w in unique_warnings])
+    from rich.panel import Panel
+    console = _console()
+    warning_content = "\n".join(f"• [bold yellow]{w}[/bold yellow]" for w in sorted(set(warnings)))
     
     console.print(Panel(
         f"[bold red]⚠️  VCS SAFETY WARNING[/bold red]\n\n"
@@ -73,24 +101,43 @@ def show_git_warnings(warnings: List[str]):
         expand=False
     ))
 
-def show_side_by_side_diff(file_path: str, old_content: str, new_content: str):
+def show_side_by_side_diff(file_path: str, old_content: str, new_content: str, context: int = 3):
     """
     Renders a side-by-side YAML comparison using a layout grid for responsiveness.
+    Long manifests collapse to their changed hunks plus `context` lines.
     """
-    old_syntax = Syntax(old_content.strip(), "yaml", theme="ansi_dark", line_numbers=True)
-    new_syntax = Syntax(new_content.strip(), "yaml", theme="monokai", line_numbers=True)
+    from kubecuro.cli.formatter import side_by_side_table
+    console = _console()
 
-    layout_table = Table.grid(expand=True, padding=1)
-    layout_table.add_column(ratio=1) 
-    layout_table.add_column(ratio=1) 
+    # Equal text needs no panels; str == compares length before content
+    if old_content == new_content:
+        console.print(f"[dim]ℹ No changes needed for {file_path}.[/dim]")
+        return
 
-    layout_table.add_row(
-        Panel(old_syntax, title=f"[bold red]ORIGINAL: {file_path}[/bold red]", border_style="red"),
-        Panel(new_syntax, title=f"[bold green]HEALED: {file_path}[/bold green]", border_style="green")
-    )
-    console.print(layout_table)
+    console.print(side_by_side_table(file_path, old_content, new_content, context))
     console.print("─" * console.width)
 
+# Batch options shared by scan and fix, declared once so the commands cannot drift
+_BATCH_OPTIONS = (
+    click.option("--jobs", "-j", type=click.IntRange(min=1), default=None, show_default="CPU count, max 8",
+                 help="Worker processes for batch runs (1 = serial)"),
+    click.option("--sort/--no-sort", "sort_reports", default=True, show_default=True,
+                 help="Order report rows by manifest path"),
+    click.option("--diff-context", type=click.IntRange(min=0), default=3, show_default=True,
+                 help="Unchanged lines around each hunk when long manifests are diffed"),
+    click.option("--diff-limit", type=click.IntRange(min=0), default=20, show_default=True,
+                 help="Maximum diffs rendered per run (0 = no limit)"),
+    click.option("--full-table", is_flag=True, help="Draw every row of very large report tables"),
+    click.option("--follow-symlinks/--no-follow-symlinks", default=False, show_default=True,
+                 help="Follow symlinks that stay inside the scanned directory"),
+)
+
+def batch_options(command):
+    """Applies _BATCH_OPTIONS to a command, in the order they are listed."""
+    for option in reversed(_BATCH_OPTIONS):
+        command = option(command)
+    return command
+
 # --- CLI DEFINITION ---
 @click.group(
     invoke_without_command=True,
@@ -108,18 +155,10 @@ def show_side_by_side_diff(file_path: str, old_content: str, new_content: str):
 @click.pass_context
 def cli(ctx, quiet):
     ctx.info_name = "kubecuro"
-    if not quiet and ctx.invoked_subcommand is None:
-        print_header()
-    
     if ctx.invoked_subcommand is None:
-        console.print("\n[bold cyan]COMMANDS:[/bold cyan]")  # Custom header
-        console.print("  scan    Audit manifests for issues")
-        console.print("  fix     Apply logical healing and fix manifest errors")
-        console.print("\n[bold cyan]GLOBAL OPTIONS:[/bold cyan]")
-        console.print("  -q, --quiet     Hide banner for scripts/automation")
-        console.print("  -v, --version   Print version information")
-        console.print("  -h, --help      Show this help")
-        console.print("\n[bold magenta]💡 TIP:[/bold magenta] Run [cyan]kubecuro scan/fix --help[/cyan] for options")
+        if not quiet:
+            print_header()
+        click.echo(_COMMANDS_HELP, color=_use_color())
 
 @cli.command(help="Audit manifests for issues")
 @click.help_option("-h", "--help", help="Show detailed command help")
@@ -132,7 +171,9 @@ def cli(ctx, quiet):
               help="Max folder recursion depth (default: 10)")
 @click.option("--ext", default=".yaml,.yml", 
               help="File extensions (default: .yaml,.yml)")
-def scan(path, diff, max_depth, ext, strict, output):
+@batch_options
+def scan(path, diff, max_depth, ext, strict, output, jobs, sort_reports, diff_context, diff_limit, full_table,
+         follow_symlinks):
     """Audit K8s manifests for errors without making changes
     
        Examples:
@@ -141,7 +182,9 @@ def scan(path, diff, max_depth, ext, strict, output):
        kubecuro scan . --diff             # Show suggested fixes
     
     """
-    run_processing_loop(path, dry_run=True, diff=diff, max_depth=max_depth, ext=ext, strict=strict, output=output)
+    run_processing_loop(path, dry_run=True, diff=diff, max_depth=max_depth, ext=ext, strict=strict, output=output, jobs=jobs,
+                        sort_reports=sort_reports, diff_context=diff_context, diff_limit=diff_limit,
+                        full_table=full_table, follow_symlinks=follow_symlinks)
 
 @cli.command(help="Apply logical healing and fix manifest errors")
 @click.help_option("-h", "--help", help="Show detailed command help")
@@ -161,7 +204,9 @@ def scan(path, diff, max_depth, ext, strict, output):
 @click.option("--ext", default=".yaml,.yml", 
               help="File extensions (default: .yaml,.yml)")
 @click.option("--strict", is_flag=True, help="Fail on unknown fields")
-def fix(path, dry_run, diff, yes, yes_all, force, max_depth, ext, strict, output):
+@batch_options
+def fix(path, dry_run, diff, yes, yes_all, force, max_depth, ext, strict, output, jobs, sort_reports, diff_context,
+        diff_limit, full_table, follow_symlinks):
     """Auto-heal Kubernetes manifests with safety gates
     
     Examples:
@@ -170,59 +215,76 @@ def fix(path, dry_run, diff, yes, yes_all, force, max_depth, ext, strict, output
         kubecuro fix deployment.yaml -y   # Single file, no prompt
         kubecuro fix . -o json --yes-all  # Batch automation
     """
-    run_processing_loop(path, dry_run, diff, max_depth, ext, strict, force, yes, yes_all, output)
+    run_processing_loop(path, dry_run, diff, max_depth, ext, strict, force, yes, yes_all, output, jobs, sort_reports,
+                        diff_context, diff_limit, full_table, follow_symlinks)
 
 # --- CORE LOGIC ORCHESTRATOR ---
 
-def run_processing_loop(path, dry_run, diff, max_depth, ext, strict, force=False, yes=False, yes_all=False, output='table'):
+def run_processing_loop(path, dry_run, diff, max_depth, ext, strict, force=False, yes=False, yes_all=False, output='table', jobs=1, sort_reports=True,
+                        diff_context=3, diff_limit=20, full_table=False, follow_symlinks=False):
     """
     Core loop for manifest processing. Handles discovery and batch safety confirmations.
     """
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
+    console = _console()
+
     input_path = Path(path).resolve()
     workspace = input_path if input_path.is_dir() else input_path.parent
-    
-    # Catalog Discovery Logic
-    if hasattr(sys, '_MEIPASS'):
-        base_path = Path(sys._MEIPASS)
-    else:
-        base_path = Path(__file__).resolve().parent
 
-    search_locations = [
-        base_path / "catalog" / "k8s_v1_distilled.json",
-        Path("catalog/k8s_v1_distilled.json") # Local development fallback
-    ]
+    # Safety Gate: never bulk-write across / or the home directory; one
+    # named file there (kubecuro fix ~/deploy.yaml) is not a bulk run
+    if not dry_run and input_path.is_dir() and is_forbidden_root(input_path):
+        console.print(f"[bold red]Refusing to fix manifests directly under {workspace}.[/bold red] "
+                      f"Point kubecuro at a project directory instead.")
+        sys.exit(1)
     
-    catalog = ""
-    for loc in search_locations:
-        if loc.exists():
-            catalog = str(loc)
-            break
-            
-    if not catalog:
+    try:
+        catalog = find_catalog()
+    except FileNotFoundError:
         console.print("[bold red]CRITICAL ERROR:[/bold red] Schema catalog is missing.")
         sys.exit(1)
-
-    engine = AuditEngineV3(str(workspace), catalog)
     
     # Discovery with Symlink Protection
+    skipped_links: List[str] = []
+    unreadable_dirs: List[str] = []
+    # Targets are kept as workspace-relative strings: the engine takes
+    # relative paths, so no Path object is built per discovered file
     if input_path.is_file():
-        target_files = [input_path]
+        target_files = [input_path.name]
     else:
-        extensions = [e.lstrip('.') for e in ext.split(',')]
-        target_files = []
-        for e in extensions:
-            target_files.extend([f for f in input_path.rglob(f"*.{e}") if f.is_file() and not f.is_symlink()])
-        target_files = sorted(list(set(target_files)))
-
-    if not target_files:
+        extensions = tuple(f".{e.strip().lstrip('.')}" for e in ext.split(',') if e.strip())
+        # Single scandir walk covers every extension; symlinks are only
+        # followed on request, and never out of the workspace
+        found = list(iter_yaml_files(str(input_path), extensions, max_depth,
+                                     skipped=skipped_links, unreadable=unreadable_dirs,
+                                     follow_symlinks=follow_symlinks))
+        # Discovery order is only observable while --diff streams output;
+        # plain string compare is cheaper than PurePath tuple comparison.
+        # Otherwise only the finished report rows are sorted (--sort).
+        if diff:
+            found.sort()
+        # Every hit lives under the workspace; slicing off the prefix
+        # replaces a relative_to() per file
+        cut = len(os.path.join(str(workspace), ""))
+        target_files = [f[cut:] for f in found]
+
+    if unreadable_dirs:
+        console.print(f"[yellow]⚠️  {len(unreadable_dirs)} director(ies) could not be read and were skipped.[/yellow]")
+
+    # Counted once; the gate, progress total and pool check all reuse it
+    n_targets = len(target_files)
+    if not n_targets:
         console.print(f"\n[bold yellow]⚠️  No valid {ext} manifests found.[/bold yellow]")
+        if skipped_links:
+            console.print(f"[dim]{len(skipped_links)} matching symlink(s) were skipped (not followed, or leading outside the workspace).[/dim]")
         return
 
     # Safety Gate: Bulk confirmation
     if not dry_run:
-        if len(target_files) > 1 and not yes_all:
+        if n_targets > 1 and not yes_all:
             console.print(Panel(
-                f"[bold red]⚠️  SAFETY GATE: BULK FIX ({len(target_files)} manifests)[/bold red]\n\n"
+                f"[bold red]⚠️  SAFETY GATE: BULK FIX ({n_targets} manifests)[/bold red]\n\n"
                 f"[yellow]⚠️   Use `kubecuro fix . --dry-run --diff` FIRST to preview changes[/yellow]\n"
                 f"[white]Target: {path}[/white]\n\n"
                 f"[bold cyan]🚀 CONFIRM to auto-heal ALL manifests[/bold cyan]",
@@ -234,7 +296,18 @@ def run_processing_loop(path, dry_run, diff, max_depth, ext, strict, force=False
                 console.print("[bold red]✓ Aborted safely[/bold red]")
                 return
 
+    # The engine (YAML stack + catalog) is only loaded once there is work
+    # to do: empty directories and aborted fixes never pay for it.
+    from kubecuro.core.engine import DEFAULT_JOBS, POOL_MIN_FILES, AuditEngineV3, audit_in_pool, safe_audit, slim_report
+    engine = AuditEngineV3(str(workspace), catalog)
+    engine.defer_directory_syncs()
+
     reports = []
+    # Table output only needs row fields; JSON keeps the full report
+    slim = output != 'json'
+    # Diffs past --diff-limit are only counted, not rendered
+    diffs_left = diff_limit or n_targets
+    suppressed_diffs = 0
 
     # Manifest Processing Progress Bar
     with Progress(
@@ -246,52 +319,77 @@ def run_processing_loop(path, dry_run, diff, max_depth, ext, strict, force=False
         console=console,
         transient=True 
     ) as progress:
-        task = progress.add_task("[cyan]Analyzing manifests...", total=len(target_files))
-        
-        for file_path in target_files:
-            try:
-                rel_parts = file_path.relative_to(workspace).parts
-                if len(rel_parts) > max_depth:
-                    progress.advance(task)
-                    continue
-
-                rel_path = str(file_path.relative_to(workspace))
+        task = progress.add_task("[cyan]Analyzing manifests...", total=n_targets)
+        # Relabel roughly 100 times per run; other files only advance the bar
+        label_every = max(1, n_targets // 100)
+
+        # Independent files fan out to worker processes; --diff stays serial
+        # because its output must follow file order.
+        # Unset --jobs means one worker per core, capped at DEFAULT_JOBS
+        jobs = jobs or DEFAULT_JOBS
+        if jobs > 1 and not diff and n_targets >= POOL_MIN_FILES:
+            reports = audit_in_pool(engine, target_files, jobs, dry_run, force, strict, slim,
+                                    on_done=lambda done, rel_path: progress.advance(task))
+            target_files = []
+
+        for index, rel_path in enumerate(target_files):
+            if index % label_every == 0:
                 progress.update(task, description=f"[cyan]{rel_path}[/cyan]")
-                
-                old_content = file_path.read_text(encoding='utf-8-sig')
-                report = engine.audit_and_heal_file(rel_path, dry_run=dry_run, force_write=force, strict=strict)
-                reports.append(report)
-
-                if diff and report.get('healed_content'):
-                    progress.stop()
-                    console.print(f"\n[bold cyan]Diagnostic Analysis for: {rel_path}[/bold cyan]")
-                    if report.get("logic_logs"):
-                        show_shield_logs(report["logic_logs"])
-                    show_side_by_side_diff(rel_path, old_content, report['healed_content'])
-                    progress.start()
-                
-                progress.advance(task)
-
-            except Exception as e:
-                reports.append({
-                    "file_path": file_path.name, "status": "ENGINE_ERROR", 
-                    "error": str(e), "success": False, "kind": "Unknown", "git_warnings": []
-                })
-                progress.advance(task)
-
-        progress.update(task, completed=len(target_files), description="[bold green]✓ Analysis complete[/bold green]")
+
+            # Failures come back as ENGINE_ERROR reports instead of raising
+            report = safe_audit(engine, rel_path, dry_run=dry_run, force_write=force, strict=strict,
+                                keep_original=diff)
+
+            # Printing through the progress console keeps the live bar
+            # in place instead of tearing it down per file
+            if diff and report.get('healed_content') and diffs_left <= 0:
+                suppressed_diffs += 1
+            elif diff and report.get('healed_content'):
+                diffs_left -= 1
+                console.print(f"\n[bold cyan]Diagnostic Analysis for: {rel_path}[/bold cyan]")
+                if report.get("logic_logs"):
+                    show_shield_logs(report["logic_logs"])
+                show_side_by_side_diff(rel_path, report['original_content'], report['healed_content'], diff_context)
+
+            reports.append(slim_report(report) if slim else report)
+            progress.advance(task)
+
+        progress.update(task, completed=len(reports), description="[bold green]✓ Analysis complete[/bold green]")
+    engine.sync_directories()
+    engine.save_heal_stamps()
+
+    if suppressed_diffs:
+        console.print(f"[dim]{suppressed_diffs} more diff(s) suppressed; re-run with --diff-limit 0 to show all.[/dim]")
+
+    # --diff runs already follow sorted discovery order
+    if sort_reports and not diff:
+        reports.sort(key=(lambda r: r.file_path) if slim else (lambda r: r["file_path"]))
     
     if output == 'json':
+        # Encoded chunk by chunk straight to stdout: no whole-document
+        # string, and no Rich markup/wrapping pass over machine output
         import json
-        console.print(json.dumps(reports, indent=2))
+        json.dump(reports, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
         return  # Skip table output, exit early
 
-    render_summary(reports, engine)
+    render_summary(reports, engine, full_table)
 
-def render_summary(reports: List[Dict], engine: Any):
+def render_summary(reports: List[AuditReport], engine: Any, full_table: bool = False):
     """
     Constructs final execution tables, git safety warnings, and summary panels.
+    Very large batches show a preview of the table unless full_table is set.
     """
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+    from kubecuro.cli.formatter import format_status, status_markup, table_rows, report_column_widths
+    console = _console()
+
+    rows = table_rows(reports, full_table)
+    path_w, kind_w, status_w = report_column_widths(rows, ("Manifest Path", "Kind", "Status"), console.width)
+
     table = Table(
         title="\n[bold magenta]KubeCuro Execution Report[/bold magenta]", 
         show_lines=True, 
@@ -299,34 +397,31 @@ def render_summary(reports: List[Dict], engine: Any):
         box=box.MINIMAL_HEAVY_HEAD,
         expand=False
     )
-    table.add_column("Manifest Path", style="cyan", no_wrap=False)
-    table.add_column("Kind", style="white")
-    table.add_column("Status", style="bold")
-    table.add_column("Result", justify="center")
+    table.add_column("Manifest Path", style="cyan", no_wrap=False, width=path_w)
+    table.add_column("Kind", style="white", width=kind_w)
+    table.add_column("Status", style="bold", width=status_w)
+    table.add_column("Result", justify="center", width=6)
     
-    all_git_warnings = []
+    # Deduplicated as collected: batches repeat the same .gitignore warning per file
+    all_git_warnings: Set[str] = set()
 
+    # Errors and git warnings cover every report, even past the preview
     for r in reports:
-        if r.get('status') == "ENGINE_ERROR":
-            console.print(f"[bold red]Error in manifest {r['file_path']}:[/bold red] {r.get('error')}")
-
-        success = r.get('success', False)
-        partial = r.get('partial_heal', False)
-        color = "green" if success else "yellow" if partial else "red"
-        icon = "✅" if success else "⚠️" if partial else "❌"
+        if r.status == "ENGINE_ERROR":
+            console.print(f"[bold red]Error in manifest {r.file_path}:[/bold red] {r.error}")
         
         # Aggregate git warnings for final display
-        if r.get("git_warnings"):
-            all_git_warnings.extend(r["git_warnings"])
-
-        table.add_row(
-            str(r.get('file_path')), 
-            str(r.get('kind', 'Unknown')), 
-            f"[{color}]{r.get('status', 'FAILED')}[/{color}]", 
-            icon
-        )
+        if r.git_warnings:
+            all_git_warnings.update(r.git_warnings)
+
+    for r in rows:
+        color, icon = format_status(r)
+        table.add_row(r.file_path, r.kind, status_markup(color, r.status), icon)
     
     console.print(table)
+    if len(rows) < len(reports):
+        console.print(f"[dim]… {len(reports) - len(rows)} more rows; re-run with --full-table "
+                      f"or -o json for the complete report.[/dim]")
 
     # Show consolidated Git Warnings if they exist
     show_git_warnings(all_git_warnings)
@@ -344,9 +439,8 @@ def render_summary(reports: List[Dict], engine: Any):
     console.print(Panel(summary_text, border_style="cyan", expand=False))
 
 if __name__ == "__main__":
-    #print_header()
     try:
         cli()
     except KeyboardInterrupt:
-        console.print("\n[bold red]Operation terminated by user.[/bold red]")
+        _console().print("\n[bold red]Operation terminated by user.[/bold red]")
         sys.exit(1)
@@ -9,30 +9,51 @@ Author: Nishar A Sunkesala / KubeCuro Team
 Date: 2026-01-16
 """
 
+import os
 import sys
 import argparse
+import functools
 from pathlib import Path
-from typing import List, Dict, Any
-
-# Rich library components for high-fidelity terminal UI
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import (
-    Progress, 
-    SpinnerColumn, 
-    TextColumn, 
-    TimeElapsedColumn, 
-    BarColumn, 
-    TaskProgressColumn
-)
-from rich.syntax import Syntax
-
-# Core Engine import
-from kubecuro.core.engine import AuditEngineV3
-
-# Global console for consistent styling across the application
-console = Console()
+from typing import Any, Callable, Dict, List
+
+# Rich components and the Engine are imported inside the methods that use
+# them, so `--help` / `--version` skip the UI and YAML stacks entirely.
+from kubecuro.core.filesystem import find_catalog, is_forbidden_root, iter_yaml_files
+from kubecuro.core.models import AuditReport
+
+@functools.lru_cache(maxsize=1)
+def _console():
+    """Global console for consistent styling, built on first use."""
+    from rich.console import Console
+    return Console()
+
+# Subcommand name -> (help text, parser factory method)
+SUBCOMMANDS = {
+    "fix": ("❤️ Auto-heal YAML manifests", "_build_fix_parser"),
+    "scan": ("🔍 Audit manifests for errors", "_build_scan_parser"),
+}
+
+def int_at_least(minimum: int) -> Callable[[str], int]:
+    """argparse type for integers >= minimum, the counterpart of click.IntRange(min=...)."""
+    def parse(value: str) -> int:
+        number = int(value)
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"{number} is not in the range >={minimum}")
+        return number
+    # argparse names the type in its "invalid int value" message
+    parse.__name__ = "int"
+    return parse
+
+def add_batch_arguments(parser: argparse.ArgumentParser):
+    """Batch options shared by fix and scan, declared once so the subcommands cannot drift."""
+    parser.add_argument("-j", "--jobs", type=int_at_least(1), default=None, help="Worker processes for batch runs (1 = serial; default: CPU count, max 8)")
+    parser.add_argument("--sort", dest="sort_reports", action="store_true", default=True, help="Order report rows by manifest path (default)")
+    parser.add_argument("--no-sort", dest="sort_reports", action="store_false", help="Keep report rows in discovery order")
+    parser.add_argument("--diff-context", type=int_at_least(0), default=3, help="Unchanged lines around each hunk when long manifests are diffed")
+    parser.add_argument("--diff-limit", type=int_at_least(0), default=20, help="Maximum diffs rendered per run (0 = no limit)")
+    parser.add_argument("--full-table", action="store_true", help="Draw every row of very large report tables")
+    parser.add_argument("--follow-symlinks", action="store_true", help="Follow symlinks that stay inside the scanned directory")
+    parser.add_argument("--no-follow-symlinks", dest="follow_symlinks", action="store_false", help="Never follow symlinks (default)")
 
 class KubeCuroCLI:
     """
@@ -40,43 +61,63 @@ class KubeCuroCLI:
     Provides visual feedback, safety confirmations, and side-by-side diffs.
     """
 
-    def __init__(self):
-        """Initializes the CLI and sets up the argument parser."""
-        self.parser = argparse.ArgumentParser(
+    @functools.cached_property
+    def parser(self) -> argparse.ArgumentParser:
+        """
+        Top-level parser, built on first access only: subcommand runs go
+        straight to their own factory and never construct it.
+        """
+        commands = "\n".join(f"  {name:<8}{text}" for name, (text, _) in SUBCOMMANDS.items())
+        parser = argparse.ArgumentParser(
             prog="kubecuro",
-            description="KubeCuro - Kubernetes Logic Diagnostics & YAML Auto-Healer",
+            usage="kubecuro [-h] [-v] {fix,scan} ...",
+            description="KubeCuro - Kubernetes Logic Diagnostics & YAML Auto-Healer\n\n"
+                        f"Commands:\n{commands}",
             formatter_class=argparse.RawDescriptionHelpFormatter,
             epilog="Learn more: https://github.com/fixmyk8s/kubecuro"
         )
-        self._setup_args()
+        self._setup_args(parser)
+        return parser
 
     def _get_catalog_path(self) -> str:
         """
-        Retrieves the location of the K8s schema catalog dynamically.
-        Uses relative pathing to ensure portability.
+        Retrieves the location of the K8s schema catalog, or "" if missing.
+        The search itself is shared with the click CLI and runs once.
         """
-        base_path = Path(__file__).resolve().parent
-        
-        # Search priority: catalog/, src/catalog/, or root catalog/
-        search_locations = [
-            base_path / "catalog" / "k8s_v1_distilled.json",
-            base_path.parent / "catalog" / "k8s_v1_distilled.json",
-            base_path.parent.parent / "catalog" / "k8s_v1_distilled.json"
-        ]
-
-        for candidate in search_locations:
-            if candidate.exists():
-                return str(candidate)
-        
-        return ""
+        try:
+            return find_catalog()
+        except FileNotFoundError:
+            return ""
 
-    def _setup_args(self):
-        """Configures the command-line flags and subcommands."""
-        self.parser.add_argument("-v", "--version", action="version", version="kubecuro v1.0.0")
-        subparsers = self.parser.add_subparsers(dest="command", metavar="Command")
+    def _setup_args(self, parser: argparse.ArgumentParser):
+        """
+        Configures the top-level flags. Subcommand parsers are not built
+        here; _parse_args calls only the factory named in argv.
+        """
+        parser.add_argument("-v", "--version", action="version", version="kubecuro v1.0.0")
 
-        # 'fix' subcommand - The active healing mode
-        fix_parser = subparsers.add_parser("fix", help="❤️ Auto-heal YAML manifests")
+    def _parse_args(self, argv: List[str]) -> argparse.Namespace:
+        """
+        Dispatches on argv[0]: a known subcommand gets its own parser,
+        anything else (-h, -v, typos) is handled by the top-level parser.
+        """
+        if argv and argv[0] in SUBCOMMANDS:
+            command = argv[0]
+            _, factory = SUBCOMMANDS[command]
+            args = getattr(self, factory)().parse_args(argv[1:])
+            args.command = command
+            return args
+
+        if argv and not argv[0].startswith("-"):
+            self.parser.error(f"invalid choice: '{argv[0]}' (choose from 'fix', 'scan')")
+        # -h / -v exit inside parse_args; no command falls through to help
+        args = self.parser.parse_args(argv)
+        args.command = None
+        return args
+
+    def _build_fix_parser(self) -> argparse.ArgumentParser:
+        """Builds the parser of the 'fix' subcommand."""
+        fix_parser = argparse.ArgumentParser(prog="kubecuro fix", description=SUBCOMMANDS["fix"][0])
         fix_parser.add_argument("path", help="Path to a YAML file or directory")
         fix_parser.add_argument("--dry-run", action="store_true", help="Preview results without writing")
         fix_parser.add_argument("--diff", action="store_true", help="Display vertical split comparison")
@@ -86,9 +127,12 @@ class KubeCuroCLI:
         fix_parser.add_argument("--ext", default=".yaml", help="File extension filter (default: .yaml)")
         fix_parser.add_argument("--strict", action="store_true", help="Fail if unknown fields are found")
         fix_parser.add_argument("--max-depth", type=int, default=10, help="Max recursion depth for directories")
+        add_batch_arguments(fix_parser)
+        return fix_parser
 
-        # 'scan' subcommand - Read-only audit mode
-        scan_parser = subparsers.add_parser("scan", help="🔍 Audit manifests for errors")
+    def _build_scan_parser(self) -> argparse.ArgumentParser:
+        """Builds the parser of the 'scan' subcommand."""
+        scan_parser = argparse.ArgumentParser(prog="kubecuro scan", description=SUBCOMMANDS["scan"][0])
         scan_parser.add_argument("path", help="Path to scan")
         # Included dry-run in scan parser for argument consistency
         scan_parser.add_argument("--dry-run", action="store_true", default=True, help="Execute in read-only mode")
@@ -96,49 +140,68 @@ class KubeCuroCLI:
         scan_parser.add_argument("--diff", action="store_true", help="Show suggested changes in preview")
         scan_parser.add_argument("--strict", action="store_true", help="Fail if unknown fields are found")
         scan_parser.add_argument("--max-depth", type=int, default=10, help="Max recursion depth for directories")
+        add_batch_arguments(scan_parser)
+        return scan_parser
 
     def print_header(self, subtitle: str):
-        """Renders the KubeCuro splash header with themed styling."""
-        console.print(Panel.fit(
-            "[bold cyan]KubeCuro v1.0.0[/bold cyan]\n"
-            "══════════════════════════════════════════════════════════════════",
-            title=f"[bold white]{subtitle}[/bold white]",
-            border_style="cyan"
-        ))
-
-    def _show_side_by_side_diff(self, file_path: str, old_content: str, new_content: str):
-        """Renders a vertical side-by-side comparison of original vs healed YAML."""
-        old_syntax = Syntax(old_content.strip(), "yaml", theme="ansi_dark", line_numbers=True)
-        new_syntax = Syntax(new_content.strip(), "yaml", theme="monokai", line_numbers=True)
+        """
+        Renders the KubeCuro splash header as pre-baked ANSI text, in the
+        layout of the former Rich panel, so the banner never loads Rich.
+        """
+        color = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+        cyan, bold_cyan, bold_white, reset = (
+            ("\033[36m", "\033[1;36m", "\033[1;37m", "\033[0m") if color else ("", "", "", "")
+        )
+        rule = "═" * 66
+        width = len(rule) + 2
+        fill = width - len(subtitle) - 2
+        top = f"{cyan}╭{'─' * (fill // 2)} {bold_white}{subtitle}{reset}{cyan} {'─' * (fill - fill // 2)}╮{reset}"
+        sys.stdout.write("\n".join((
+            top,
+            f"{cyan}│{reset} {bold_cyan}KubeCuro v1.0.0{reset}{' ' * (len(rule) - 15)} {cyan}│{reset}",
+            f"{cyan}│{reset} {rule} {cyan}│{reset}",
+            f"{cyan}╰{'─' * width}╯{reset}",
+            "",
+        )))
+
+    def _show_side_by_side_diff(self, file_path: str, old_content: str, new_content: str, context: int = 3):
+        """
+        Renders a vertical side-by-side comparison of original vs healed YAML.
+        Long manifests collapse to their changed hunks plus `context` lines.
+        """
+        from kubecuro.cli.formatter import side_by_side_table
 
-        layout_table = Table.grid(expand=True, padding=1)
-        layout_table.add_column(ratio=1) 
-        layout_table.add_column(ratio=1) 
+        # Equal text needs no panels; str == compares length before content
+        if old_content == new_content:
+            _console().print(f"[dim]ℹ No changes needed for {file_path}.[/dim]")
+            return
 
-        layout_table.add_row(
-            Panel(old_syntax, title=f"[bold red]ORIGINAL: {file_path}[/bold red]", border_style="red"),
-            Panel(new_syntax, title=f"[bold green]HEALED: {file_path}[/bold green]", border_style="green")
-        )
-        console.print(layout_table)
+        _console().print(side_by_side_table(file_path, old_content, new_content, context))
 
     def _show_shield_logs(self, logs: List[str]):
         """Displays notifications from the Logic Shield policy engine."""
+        console = _console()
         for log in logs:
             console.print(f"🛡️  [bold cyan]SHIELD POLICY:[/bold cyan] [white]{log}[/white]")
 
     def _confirm_action(self, target_count: int, args: argparse.Namespace) -> bool:
         """Safety Gate logic: ensures the user wants to proceed with writes."""
-        if getattr(args, 'dry_run', False):
+        # scan parsers lack the write flags; resolve each one exactly once
+        dry_run, yes, yes_all = (getattr(args, flag, False) for flag in ('dry_run', 'yes', 'yes_all'))
+        if dry_run:
             return True
+
+        from rich.panel import Panel
+        console = _console()
         
         if target_count == 1:
-            if getattr(args, 'yes', False) or getattr(args, 'yes_all', False):
+            if yes or yes_all:
                 return True
             choice = console.input("\n[bold yellow]Apply fix to this file? (y/N): [/bold yellow]").lower()
             return choice == 'y'
         
         if target_count > 1:
-            if getattr(args, 'yes_all', False):
+            if yes_all:
                 return True
             
             console.print(Panel(
@@ -156,6 +219,24 @@ class KubeCuroCLI:
 
     def _run_engine(self, args: argparse.Namespace, is_fix_mode: bool):
         """Main processing loop orchestration."""
+        from rich.progress import (
+            Progress, 
+            SpinnerColumn, 
+            TextColumn, 
+            TimeElapsedColumn, 
+            BarColumn, 
+            TaskProgressColumn
+        )
+        console = _console()
+
+        # Flags are resolved once into locals; the per-file loop never
+        # touches the Namespace (scan parsers lack --force)
+        is_dry_run = getattr(args, 'dry_run', False) or not is_fix_mode
+        force = getattr(args, 'force', False)
+        strict = args.strict
+        want_diff = args.diff
+        diff_context = args.diff_context
+
         input_path = Path(args.path).resolve()
         if not input_path.exists():
             console.print(f"[bold red]Error:[/bold red] Path '{args.path}' not found.")
@@ -163,32 +244,65 @@ class KubeCuroCLI:
 
         # Workspace is the boundary for relative path calculations
         workspace = input_path if input_path.is_dir() else input_path.parent
+
+        # Safety Gate: never bulk-write across / or the home directory; one
+        # named file there (kubecuro fix ~/deploy.yaml) is not a bulk run
+        if not is_dry_run and input_path.is_dir() and is_forbidden_root(input_path):
+            console.print(f"[bold red]Refusing to fix manifests directly under {workspace}.[/bold red] "
+                          f"Point kubecuro at a project directory instead.")
+            sys.exit(1)
+
         catalog_path = self._get_catalog_path()
         if not catalog_path:
             console.print("[bold red]CRITICAL ERROR:[/bold red] Schema catalog is missing.")
             sys.exit(1)
 
-        engine = AuditEngineV3(str(workspace), catalog_path)
-        
         # Collect target files based on input type
+        skipped_links: List[str] = []
+        unreadable_dirs: List[str] = []
+        # Targets stay workspace-relative strings; no Path per discovered file
         if input_path.is_file():
-            target_files = [input_path]
+            target_files = [input_path.name]
         else:
-            target_files = sorted([
-                f for f in input_path.rglob(f"*{args.ext}") 
-                if f.is_file() and not f.is_symlink()
-            ])
-
-        if not target_files:
+            # Single scandir walk; symlinks are only followed on request,
+            # and never out of the workspace
+            found = list(iter_yaml_files(str(input_path), (args.ext,), args.max_depth,
+                                         skipped=skipped_links, unreadable=unreadable_dirs,
+                                         follow_symlinks=args.follow_symlinks))
+            # Discovery order only shows while --diff streams; sort raw strings.
+            # Otherwise only the finished report rows are sorted (--sort).
+            if want_diff:
+                found.sort()
+            # Every hit lives under the workspace; slice the prefix off once
+            cut = len(os.path.join(str(workspace), ""))
+            target_files = [f[cut:] for f in found]
+
+        if unreadable_dirs:
+            console.print(f"[yellow]⚠️  {len(unreadable_dirs)} director(ies) could not be read and were skipped.[/yellow]")
+
+        # Counted once; the gate, progress total and pool check all reuse it
+        n_targets = len(target_files)
+        if not n_targets:
             console.print(f"\n[bold yellow]⚠️  No valid YAML files found.[/bold yellow]")
+            if skipped_links:
+                console.print(f"[dim]{len(skipped_links)} matching symlink(s) were skipped (not followed, or leading outside the workspace).[/dim]")
             return
 
         # Safety confirmation for 'fix' mode
-        if is_fix_mode and not self._confirm_action(len(target_files), args):
+        if is_fix_mode and not self._confirm_action(n_targets, args):
             console.print("[bold red]Operation cancelled by user.[/bold red]")
             return
 
+        # The engine (YAML stack + catalog) is only loaded once there is work
+        # to do: empty directories and cancelled fixes never pay for it.
+        from kubecuro.core.engine import DEFAULT_JOBS, POOL_MIN_FILES, AuditEngineV3, audit_in_pool, safe_audit, slim_report
+        engine = AuditEngineV3(str(workspace), catalog_path)
+        engine.defer_directory_syncs()
+
         reports = []
+        # Diffs past --diff-limit are only counted, not rendered
+        diffs_left = args.diff_limit or n_targets
+        suppressed_diffs = 0
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -198,80 +312,100 @@ class KubeCuroCLI:
             console=console
         ) as progress:
             
-            task_id = progress.add_task("Processing manifests...", total=len(target_files))
+            task_id = progress.add_task("Processing manifests...", total=n_targets)
+            # Relabel roughly 100 times per run; other files only advance the bar
+            label_every = max(1, n_targets // 100)
+
+            # Independent files fan out to worker processes; --diff stays
+            # serial so its output follows file order.
+            # Unset --jobs means one worker per core, capped at DEFAULT_JOBS
+            jobs = args.jobs or DEFAULT_JOBS
+            if jobs > 1 and not want_diff and n_targets >= POOL_MIN_FILES:
+                def on_done(done: int, rel_path: str):
+                    if (done - 1) % label_every == 0:
+                        progress.update(task_id, advance=1, description=f"Checked: {os.path.basename(rel_path)}")
+                    else:
+                        progress.advance(task_id)
+
+                reports = audit_in_pool(engine, target_files, jobs, is_dry_run, force, strict,
+                                        slim=True, on_done=on_done)
+                target_files = []
             
-            for file_path in target_files:
-                try:
-                    # 1. Define rel_parts by splitting the relative path
-                    rel_parts = file_path.relative_to(workspace).parts
-                    current_depth = len(rel_parts)
-                    
-                    # 2. Perform the depth check immediately
-                    if current_depth > args.max_depth:
-                        continue
-                    
-                    # 3. Proceed with processing
-                    rel_path = str(file_path.relative_to(workspace))
-                    old_content = file_path.read_text(encoding='utf-8-sig')
+            for index, rel_path in enumerate(target_files):
+                # Failures come back as ENGINE_ERROR reports instead of raising
+                report = safe_audit(engine, rel_path, dry_run=is_dry_run, force_write=force,
+                                    strict=strict, keep_original=want_diff)
+
+                # Toggle diff UI if requested and modifications were found
+                # (printed through the progress console, so the live bar stays up)
+                if want_diff and report.get('healed_content') and diffs_left <= 0:
+                    suppressed_diffs += 1
+                elif want_diff and report.get('healed_content'):
+                    diffs_left -= 1
+                    console.print(f"\n[bold cyan]Analysis for: {rel_path}[/bold cyan]")
                     
-                    # Determine if this specific run should write to disk
-                    is_dry_run = getattr(args, 'dry_run', False) or not is_fix_mode
-
-                    report = engine.audit_and_heal_file(
-                        rel_path,
-                        dry_run=is_dry_run,
-                        force_write=getattr(args, 'force', False),
-                        strict=args.strict
-                    )
-                    reports.append(report)
-
-                    # Toggle diff UI if requested and modifications were found
-                    if args.diff and report.get('healed_content'):
-                        progress.stop()
-                        console.print(f"\n[bold cyan]Analysis for: {rel_path}[/bold cyan]")
+                    if report.get("logic_logs"):
+                        self._show_shield_logs(report["logic_logs"])
                         
-                        if report.get("logic_logs"):
-                            self._show_shield_logs(report["logic_logs"])
-                            
-                        self._show_side_by_side_diff(rel_path, old_content, report['healed_content'])
-                        console.print("─" * console.width)
-                        progress.start()
+                    self._show_side_by_side_diff(rel_path, report['original_content'], report['healed_content'],
+                                                 diff_context)
+                    console.print("─" * console.width)
+
+                # Only row fields are kept for the final table
+                reports.append(slim_report(report))
+
+                if index % label_every == 0:
+                    progress.update(task_id, advance=1, description=f"Checked: {os.path.basename(rel_path)}")
+                else:
+                    progress.advance(task_id)
+        engine.sync_directories()
+        engine.save_heal_stamps()
 
-                except Exception as e:
-                    reports.append({
-                        "file_path": file_path.name, "status": "ENGINE_ERROR", 
-                        "error": str(e), "success": False, "kind": "Unknown"
-                    })
+        if suppressed_diffs:
+            console.print(f"[dim]{suppressed_diffs} more diff(s) suppressed; re-run with --diff-limit 0 to show all.[/dim]")
 
-                progress.update(task_id, advance=1, description=f"Checked: {file_path.name}")
+        # --diff runs already follow sorted discovery order
+        if args.sort_reports and not want_diff:
+            reports.sort(key=lambda r: r.file_path)
 
-        self._render_final_report(reports, engine)
+        self._render_final_report(reports, engine, args.full_table)
+
+    def _render_final_report(self, reports: List[AuditReport], engine: Any, full_table: bool = False):
+        """
+        Constructs the final summary table and metrics panel.
+        Very large batches show a preview of the table unless full_table is set.
+        """
+        from rich.panel import Panel
+        from rich.table import Table
+        from kubecuro.cli.formatter import format_status, status_markup, table_rows, report_column_widths
+        console = _console()
+
+        rows = table_rows(reports, full_table)
+        path_w, kind_w, status_w = report_column_widths(rows, ("File Path", "Kind", "Status"), console.width)
 
-    def _render_final_report(self, reports: List[Dict], engine: Any):
-        """Constructs the final summary table and metrics panel."""
         table = Table(title="KubeCuro Execution Report", show_lines=True, header_style="bold magenta")
-        table.add_column("File Path", style="cyan")
-        table.add_column("Kind", style="white")
-        table.add_column("Status", style="bold")
-        table.add_column("Result", justify="center")
+        table.add_column("File Path", style="cyan", width=path_w)
+        table.add_column("Kind", style="white", width=kind_w)
+        table.add_column("Status", style="bold", width=status_w)
+        table.add_column("Result", justify="center", width=6)
 
+        # Handle system-level crashes explicitly in the UI, even past the preview
         for r in reports:
-            # Handle system-level crashes explicitly in the UI
-            if r.get('status') == "ENGINE_ERROR":
-                console.print(f"[bold red]Error in {r['file_path']}:[/bold red] {r.get('error')}")
-            
-            success = r.get('success', False)
-            partial = r.get('partial_heal', False)
-            status_color = "green" if success else "yellow" if partial else "red"
-            result_icon = "✅" if success else "⚠️" if partial else "❌"
+            if r.status == "ENGINE_ERROR":
+                console.print(f"[bold red]Error in {r.file_path}:[/bold red] {r.error}")
+
+        for r in rows:
+            status_color, result_icon = format_status(r)
             
             table.add_row(
-                str(r.get('file_path')), str(r.get('kind', 'Unknown')),
-                f"[{status_color}]{r.get('status', 'FAILED')}[/{status_color}]",
+                r.file_path, r.kind,
+                status_markup(status_color, r.status),
                 result_icon
             )
 
         console.print(table)
+        if len(rows) < len(reports):
+            console.print(f"[dim]… {len(reports) - len(rows)} more rows; re-run with --full-table to see them all.[/dim]")
         
         # Retrieve computed statistics from the Engine
         summary = engine.generate_summary(reports)
@@ -287,12 +421,9 @@ class KubeCuroCLI:
 
     def run(self):
         """Primary routing entry point for CLI commands."""
-        if len(sys.argv) == 1:
-            self.print_header("K8s Diagnostics & Healer")
-            self.parser.print_help()
-            sys.exit(0)
-
-        args = self.parser.parse_args()
+        # An empty argv parses to command=None, so bare `kubecuro` shares
+        # the single header + help path below (Rich is never imported)
+        args = self._parse_args(sys.argv[1:])
         if args.command == "scan":
             self.print_header("Logic Audit Scan")
             self._run_engine(args, is_fix_mode=False)
@@ -300,6 +431,7 @@ class KubeCuroCLI:
             self.print_header("YAML Auto-Heal Engine")
             self._run_engine(args, is_fix_mode=True)
         else:
+            self.print_header("K8s Diagnostics & Healer")
             self.parser.print_help()
 
 def main():
@@ -311,7 +443,7 @@ def main():
     try:
         KubeCuroCLI().run()
     except KeyboardInterrupt:
-        console.print("\n[bold red]Terminated by user.[/bold red]")
+        _console().print("\n[bold red]Terminated by user.[/bold red]")
         sys.exit(1)
 
 if __name__ == "__main__":
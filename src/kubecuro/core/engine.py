@@ -11,24 +11,263 @@ Date: 2026-01-16
 """
 
 import os
+import re
 import sys
 import shutil
+import stat
+import tempfile
 import time
 import json
+import pickle
+import hashlib
+import functools
+import itertools
 import logging
+import multiprocessing.util
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, NamedTuple, Optional, Callable, Sequence, Set, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: heal stamp saves merge without a lock
+    fcntl = None
 
 # Modular imports aligned with the 2026-01-16 surgical suite
 from kubecuro.healing.pipeline import HealingPipeline
 from kubecuro.healing.exporter import KubeExporter
 from kubecuro.rules.shield import ShieldEngine
 from kubecuro.validator.validator import KubeValidator
+from kubecuro.core.models import AuditReport
+from kubecuro.core.filesystem import ManifestTooLarge, iter_matching_entries, iter_yaml_files, read_yaml_text
 
 # Setup standardized logging for engine diagnostics
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("kubecuro.engine")
 
+# Per-process engine used by parallel batch workers (see init_worker)
+_WORKER_ENGINE: Optional["AuditEngineV3"] = None
+
+# Default worker count for batch runs: past ~8 processes the per-worker
+# catalog load and disk contention outweigh the extra cores
+DEFAULT_JOBS = min(os.cpu_count() or 1, 8)
+# Smaller batches run serially; spawning workers would cost more than it saves
+POOL_MIN_FILES = 5
+
+def init_worker(workspace_path: str, catalog_path: str, cpu: str = "500m", mem: str = "512Mi"):
+    """
+    ProcessPoolExecutor initializer: builds one engine per worker process
+    so the catalog is loaded once per worker rather than pickled per task.
+    """
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = AuditEngineV3(workspace_path, catalog_path, cpu, mem)
+    _WORKER_ENGINE.defer_directory_syncs()
+    # Workers end without returning to the caller: sync their directories
+    # when the worker process shuts down
+    multiprocessing.util.Finalize(None, _WORKER_ENGINE.sync_directories, exitpriority=10)
+
+def audit_in_worker(relative_path: str, dry_run: bool = True, force_write: bool = False,
+                    strict: bool = False, slim: bool = False,
+                    target_version: str = "v1.31") -> Tuple[Union[Dict[str, Any], AuditReport], Dict[tuple, tuple]]:
+    """
+    Picklable task entry point that delegates to the worker's engine.
+    With slim=True only the AuditReport row travels back to the parent.
+    Heal stamps the task produced travel back with the report, so the
+    parent saves the store once instead of every worker rewriting it.
+    """
+    report = safe_audit(_WORKER_ENGINE, relative_path, dry_run=dry_run,
+                        force_write=force_write, strict=strict, target_version=target_version)
+    return (slim_report(report) if slim else report), _WORKER_ENGINE.take_new_heal_stamps()
+
+def audit_in_pool(engine: "AuditEngineV3", rel_paths: Sequence[str], jobs: int,
+                  dry_run: bool = True, force_write: bool = False, strict: bool = False,
+                  slim: bool = False, target_version: str = "v1.31",
+                  on_done: Optional[Callable[[int, str], None]] = None) -> List[Union[Dict[str, Any], AuditReport]]:
+    """
+    Audits files on a process pool, one copy of engine per worker (see
+    init_worker); engine must have been built from a catalog path.
+    Reports come back in rel_paths order regardless of completion order;
+    on_done(completed_count, rel_path) is called as each file finishes.
+    Failures come back as ENGINE_ERROR reports rather than aborting the batch.
+    The workers' new heal stamps are queued on engine for save_heal_stamps.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    reports: List[Any] = [None] * len(rel_paths)
+    # Every worker loads its own catalog, so never start more than there are files
+    with ProcessPoolExecutor(max_workers=min(jobs, len(rel_paths)), initializer=init_worker,
+                             initargs=engine._worker_initargs) as pool:
+        futures = {
+            pool.submit(audit_in_worker, rel_path, dry_run, force_write, strict, slim, target_version): i
+            for i, rel_path in enumerate(rel_paths)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            try:
+                reports[i], stamps = future.result()
+                engine.add_heal_stamps(stamps)
+            except Exception as e:
+                # Audit failures are already reports; only pool-level errors
+                # (a crashed worker, an unpicklable result) land here
+                logger.error(f"Worker failed on {rel_paths[i]}: {str(e)}")
+                failure = engine_error_report(rel_paths[i], e)
+                reports[i] = slim_report(failure) if slim else failure
+            if on_done:
+                on_done(done, rel_paths[i])
+    return reports
+
+def engine_error_report(relative_path: str, error: BaseException) -> Dict[str, Any]:
+    """
+    The ENGINE_ERROR report recorded for a file whose audit raised.
+    The exception type is kept so failures stay debuggable from the table.
+    """
+    return {
+        "file_path": os.path.basename(relative_path), "status": "ENGINE_ERROR",
+        "error": f"{type(error).__name__}: {error}", "success": False,
+        "kind": "Unknown", "git_warnings": []
+    }
+
+def safe_audit(engine: "AuditEngineV3", relative_path: str, **kwargs: Any) -> Dict[str, Any]:
+    """
+    audit_and_heal_file that never raises: failures come back as an
+    ENGINE_ERROR report, so batch loops need no try/except of their own.
+    """
+    try:
+        return engine.audit_and_heal_file(relative_path, **kwargs)
+    except Exception as e:
+        return engine_error_report(relative_path, e)
+
+def slim_report(report: Dict[str, Any]) -> AuditReport:
+    """
+    Reduces an engine result to its table row. Healed/original text and
+    logic logs are dropped once any diff for the file has been shown.
+    """
+    return AuditReport.from_result(report)
+
+# Catalogs smaller than this parse faster than a cache round-trip pays back
+CATALOG_CACHE_MIN_BYTES = 64 * 1024
+# Bumped whenever the pickled layout changes, invalidating old cache files
+CATALOG_CACHE_VERSION = 1
+
+def _catalog_cache_dir() -> Path:
+    """Per-user cache directory (XDG_CACHE_HOME, else ~/.cache)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "kubecuro"
+
+def load_catalog(catalog_file: Path) -> Dict[str, Any]:
+    """
+    Loads the K8s schema catalog JSON. Large catalogs are also pickled
+    into the user cache and reused while the source's size and mtime
+    still match; any cache problem silently falls back to the JSON.
+    """
+    st = catalog_file.stat()
+    if st.st_size < CATALOG_CACHE_MIN_BYTES:
+        # json.loads takes the raw bytes: no text-mode decoding layer
+        return json.loads(catalog_file.read_bytes())
+
+    source = str(catalog_file)
+    key = (CATALOG_CACHE_VERSION, source, st.st_size, st.st_mtime_ns)
+    cache_file = _catalog_cache_dir() / f"catalog-{hashlib.sha1(source.encode()).hexdigest()}.pkl"
+
+    try:
+        with open(cache_file, 'rb') as f:
+            # The key is pickled separately so a stale cache is rejected
+            # before its catalog body is ever unpickled
+            if pickle.load(f) == key:
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError):
+        pass
+
+    catalog = json.loads(catalog_file.read_bytes())
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(temp_file, 'wb') as f:
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        logger.debug(f"Catalog cache not written to {cache_file}")
+    return catalog
+
+@functools.lru_cache(maxsize=8)
+def _memoized_catalog(source: str, size: int, mtime_ns: int) -> Dict[str, Any]:
+    """load_catalog memoized on the file's identity (size and mtime are the key)."""
+    return load_catalog(Path(source))
+
+def shared_catalog(catalog_file: Path) -> Dict[str, Any]:
+    """
+    Process-wide catalog: engines built over the same, unchanged catalog
+    file share one parsed dict, which every consumer treats as read-only.
+    Editing the file changes its size/mtime and so triggers a reload.
+    """
+    st = catalog_file.stat()
+    return _memoized_catalog(str(catalog_file), st.st_size, st.st_mtime_ns)
+
+# KubeCuro artifacts that should be git-ignored; matched as raw bytes so
+# .gitignore is never decoded
+GIT_IGNORE_ENTRIES = ("*.kubecuro.backup", "*.kubecuro.tmp")
+_GIT_IGNORE_BYTES = tuple((entry, entry.encode()) for entry in GIT_IGNORE_ENTRIES)
+
+BACKUP_SUFFIX = ".kubecuro.backup"
+# "<stem>-<n>" part of a numbered backup name
+_NUMBERED_BACKUP = re.compile(r"(.*)-(\d+)")
+
+# Distinct manifest texts whose heal outcome is remembered per engine
+HEAL_CACHE_SIZE = 512
+
+# Cheap pre-filter: a file with no apiVersion or kind key (CI configs,
+# Helm values) cannot be healed into a K8s resource. Only keys count, so
+# "# any kind of runner" does not match; broken "kind:Pod" still does.
+_K8S_KEY = re.compile(r"^\s*-?\s*(apiVersion|kind)\s*:", re.M)
+
+# Texts that healing leaves unchanged are remembered across runs in the
+# user cache, so re-scanning an already-healed workspace skips the pipeline
+HEAL_STAMPS_VERSION = 1
+HEAL_STAMPS_LIMIT = 100_000
+# Modules whose logic decides a heal outcome; editing any of them
+# invalidates every stored stamp
+_HEAL_LOGIC_MODULES = (
+    "kubecuro.healing.pipeline", "kubecuro.healing.lexer", "kubecuro.healing.scanner",
+    "kubecuro.healing.shadow", "kubecuro.healing.structurer", "kubecuro.healing.exporter",
+    "kubecuro.rules.shield", "kubecuro.validator.validator", __name__,
+)
+
+def _heal_stamps_file(catalog_file: Path, cpu: str, mem: str) -> Path:
+    """
+    The heal stamp store of one catalog/cpu/mem configuration, next to
+    the catalog cache. Other configurations keep their own files; a
+    store written by older heal logic is simply replaced by the next save.
+    """
+    source = repr((str(catalog_file), cpu, mem))
+    return _catalog_cache_dir() / f"heal-stamps-{hashlib.sha1(source.encode()).hexdigest()}.pkl"
+
+def _heal_logic_identity() -> Tuple[Any, ...]:
+    """(module, size, mtime_ns) of the heal logic; frozen builds use the executable."""
+    if getattr(sys, "frozen", False):
+        st = os.stat(sys.executable)
+        return ((sys.executable, st.st_size, st.st_mtime_ns),)
+    identity = []
+    for name in _HEAL_LOGIC_MODULES:
+        try:
+            st = os.stat(sys.modules[name].__file__)
+            identity.append((name, st.st_size, st.st_mtime_ns))
+        except (KeyError, AttributeError, TypeError, OSError):
+            identity.append((name, None, None))
+    return tuple(identity)
+
+class _HealOutcome(NamedTuple):
+    """Everything phases 2-4 derive from a manifest's text."""
+    kind: Optional[str]
+    api_version: Optional[str]
+    final_yaml: str
+    logic_logs: Tuple[str, ...]
+    validation_error: str
+    success: bool
+    partial_heal: bool
+    is_modified: bool
+
 class AuditEngineV3:
     """
     Principal Orchestrator for Kubernetes manifest healing.
@@ -37,27 +276,35 @@ class AuditEngineV3:
     """
 
     def __init__(self, workspace_path: str, catalog_path: str, 
-                 cpu: str = "500m", mem: str = "512Mi"):
+                 cpu: str = "500m", mem: str = "512Mi",
+                 catalog: Optional[Dict[str, Any]] = None):
         """
         Initializes the V3 engine with workspace and K8s schema catalog.
         Supports both local dev and PyInstaller environments.
+        An already-parsed catalog may be passed instead; catalog_path is
+        then not read, and the dict is shared (never modified).
         """
         self.workspace = Path(workspace_path).resolve()
-        
-        # Support for PyInstaller binary environments via _MEIPASS
-        base_path = getattr(sys, '_MEIPASS', os.path.abspath("."))
-        resolved_catalog = Path(base_path) / catalog_path
+        self._workspace_prefix = str(self.workspace)
 
-        try:
-            # Fallback for local development structures if PyInstaller path fails
-            if not resolved_catalog.exists():
-                resolved_catalog = Path(catalog_path).resolve()
-
-            with open(resolved_catalog, 'r') as f:
-                self.catalog = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.error(f"Critical Failure: Unable to load catalog from {resolved_catalog}")
-            raise RuntimeError(f"Failed to load catalog: {str(e)}")
+        # Heal stamps (see HEAL_STAMPS_VERSION) need a catalog file identity
+        self._stamps_fingerprint: Optional[Tuple[Any, ...]] = None
+        self._stamps_file: Optional[Path] = None
+        if catalog is not None:
+            self.catalog = catalog
+            # A handed-in dict cannot be rebuilt in worker processes
+            self._worker_initargs: Optional[Tuple[str, str, str, str]] = None
+        else:
+            catalog_file = self._resolve_catalog_path(catalog_path)
+            self.catalog = self._load_catalog_file(catalog_path)
+            self._worker_initargs = (self._workspace_prefix, catalog_path, cpu, mem)
+            try:
+                st = os.stat(catalog_file)
+                self._stamps_fingerprint = (HEAL_STAMPS_VERSION, str(catalog_file), st.st_size,
+                                            st.st_mtime_ns, cpu, mem, _heal_logic_identity())
+                self._stamps_file = _heal_stamps_file(catalog_file, cpu, mem)
+            except OSError:
+                pass
             
         # Initialize the specialized Healing Suite components
         self.pipeline = HealingPipeline(self.catalog)
@@ -66,71 +313,126 @@ class AuditEngineV3:
         
         # Shield is initialized with CLI-provided resource limits
         self.shield = ShieldEngine(cpu_limit=cpu, mem_limit=mem)
+
+        # Heal outcomes keyed by content digest: templated/copied manifests
+        # are healed once per batch (bounded LRU, see HEAL_CACHE_SIZE)
+        self._heal_cache: "OrderedDict[tuple, _HealOutcome]" = OrderedDict()
+        # (.gitignore mtime_ns, size) -> warnings; see check_git_safety
+        self._git_warnings_cache: Optional[Tuple[Tuple[int, int], Tuple[str, ...]]] = None
+        # directory -> {stem: highest backup index taken}, 0 = unnumbered name
+        self._backup_counters: Dict[str, Dict[str, int]] = {}
+        # Persistent heal stamps: loaded on first use, new ones saved by save_heal_stamps
+        self._heal_stamps: Optional[Dict[tuple, tuple]] = None
+        self._new_heal_stamps: Dict[tuple, tuple] = {}
+        # Directories whose fsync is postponed to sync_directories (batch mode)
+        self._deferred_dir_syncs: Optional[Set[str]] = None
         
         self._ensure_workspace()
 
+    @staticmethod
+    def _resolve_catalog_path(catalog_path: str) -> Path:
+        """Where catalog_path points, honouring PyInstaller's _MEIPASS."""
+        # Support for PyInstaller binary environments via _MEIPASS. The CLIs
+        # pass find_catalog()'s absolute path, which needs no probing.
+        base_path = getattr(sys, '_MEIPASS', os.path.abspath("."))
+        resolved_catalog = Path(base_path) / catalog_path
+        # Fallback for local development structures if PyInstaller path fails
+        if not os.path.isabs(catalog_path) and not resolved_catalog.exists():
+            resolved_catalog = Path(catalog_path).resolve()
+        return resolved_catalog
+
+    @staticmethod
+    def _load_catalog_file(catalog_path: str) -> Dict[str, Any]:
+        """Resolves and loads (via the shared cache) the catalog at catalog_path."""
+        resolved_catalog = AuditEngineV3._resolve_catalog_path(catalog_path)
+        try:
+            return shared_catalog(resolved_catalog)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            logger.error(f"Critical Failure: Unable to load catalog from {resolved_catalog}")
+            raise RuntimeError(f"Failed to load catalog: {str(e)}")
+
     def _ensure_workspace(self):
         """Validates/Creates target workspace to prevent OS path errors."""
         if not self.workspace.exists():
             logger.info(f"Creating missing workspace: {self.workspace}")
             self.workspace.mkdir(parents=True, exist_ok=True)
 
+    def _heal_text(self, raw_text: str, strict: bool, target_version: str) -> _HealOutcome:
+        """Runs healing, shielding, validation and export over one manifest's text."""
+        # Phase 2: Healing Pipeline (Surgery)
+        context = self.pipeline.run(raw_text)
+        context.cluster_version = target_version
+        healed_docs = context.reconstructed_docs or []
+        
+        # Phase 3: Shielding & Validation, each over the whole manifest
+        protected_docs, all_logic_logs = self.shield.protect_batch(healed_docs)
+
+        # Verify that the heal didn't break K8s structural logic
+        failures = [err for valid, err in self.validator.validate_batch(protected_docs, strict=strict) if not valid]
+        validation_passed = not failures
+        validation_error = failures[-1] if failures else ""
+
+        # Phase 4: Canonical Export
+        final_yaml = self.exporter.export(protected_docs, context)
+
+        # Verification logic
+        success = bool(context.kind and protected_docs and validation_passed)
+        # Exact equality is a plain memcmp with no copies; only texts that
+        # differ pay for the whitespace-tolerant strip() comparison
+        is_modified = raw_text != final_yaml and raw_text.strip() != final_yaml.strip()
+        return _HealOutcome(
+            kind=context.kind, api_version=context.api_version, final_yaml=final_yaml,
+            logic_logs=tuple(all_logic_logs), validation_error=validation_error,
+            success=success, partial_heal=not success and len(context.shards) > 0,
+            is_modified=is_modified,
+        )
+
     def audit_and_heal_file(self, relative_path: str, dry_run: bool = True, 
                             force_write: bool = False, strict: bool = False,
-                            target_version: str = "v1.31") -> Dict[str, Any]:
+                            target_version: str = "v1.31", keep_original: bool = False) -> Dict[str, Any]:
         """
         Performs a full audit and healing cycle on a single manifest.
         Handles reading, healing, shielding, and atomic writing.
+        The pre-heal text is only kept in the report when keep_original
+        is set (diff rendering); otherwise it is dropped after healing.
         """
-        full_path = (self.workspace / relative_path).resolve()
-        
-        if not full_path.exists():
-            return self._file_error(relative_path, "FILE_NOT_FOUND", f"Path missing: {full_path}")
-
-        # State Tracking
-        success = False
-        partial_heal = False
-        is_modified = False
-        final_yaml = ""
-        all_logic_logs = []
-        validation_error = ""
+        # Plain join: reading needs no canonical path, so the per-component
+        # lstat chain of resolve() is only paid below when writing
+        full_path = os.path.join(self._workspace_prefix, relative_path)
 
         try:
-            # Phase 1: Read (UTF-8 BOM-aware)
-            raw_text = full_path.read_text(encoding='utf-8-sig')
+            # Phase 1: Read (UTF-8 BOM-aware, raw fd read)
+            raw_text = read_yaml_text(full_path)
+            if not _K8S_KEY.search(raw_text):
+                return self._not_kubernetes(relative_path)
 
-            # Phase 2: Healing Pipeline (Surgery)
-            context = self.pipeline.run(raw_text)
-            context.cluster_version = target_version
-            healed_docs = context.reconstructed_docs or []
-            
-            # Phase 3: Shielding & Validation
-            protected_docs = []
-            validation_passed = True
+            # Phases 2-4 depend only on the text and the validation settings
+            key = (hashlib.blake2b(raw_text.encode(), digest_size=16).digest(), strict, target_version)
+            outcome = self._heal_cache.get(key)
+            if outcome is None:
+                outcome = self._stamped_outcome(key, raw_text)
+                if outcome is None:
+                    outcome = self._heal_text(raw_text, strict, target_version)
+                    self._stamp(key, outcome)
+                self._heal_cache[key] = outcome
+                if len(self._heal_cache) > HEAL_CACHE_SIZE:
+                    self._heal_cache.popitem(last=False)
+            else:
+                self._heal_cache.move_to_end(key)
 
-            for doc in healed_docs:
-                protected_doc, logs = self.shield.protect(doc)
-                
-                # Verify that the heal didn't break K8s structural logic
-                valid, err = self.validator.validate_reconstruction(protected_doc, strict=strict)
-                if not valid:
-                    validation_passed = False
-                    validation_error = err
-                
-                protected_docs.append(protected_doc)
-                all_logic_logs.extend(logs)
-
-            # Phase 4: Canonical Export
-            final_yaml = self.exporter.export(protected_docs, context)
-
-            # Verification logic
-            success = bool(context.kind and protected_docs and validation_passed)
-            partial_heal = not success and len(context.shards) > 0
-            is_modified = raw_text.strip() != final_yaml.strip()
+            final_yaml = outcome.final_yaml
+            success = outcome.success
+            partial_heal = outcome.partial_heal
+            is_modified = outcome.is_modified
 
             # CLI Status mapping
             display_status = self._derive_status(is_modified, dry_run, success, partial_heal)
 
+        except FileNotFoundError:
+            # No exists() pre-check: the read itself reports a vanished file
+            return self._file_error(relative_path, "FILE_NOT_FOUND", f"Path missing: {full_path}")
+        except ManifestTooLarge as e:
+            return self._file_error(relative_path, "FILE_TOO_LARGE", str(e))
         except Exception as e:
             logger.error(f"Error processing {relative_path}: {str(e)}")
             return self._file_error(relative_path, "ENGINE_ERROR", str(e))
@@ -141,25 +443,42 @@ class AuditEngineV3:
             "success": success or not is_modified,
             "partial_heal": partial_heal,
             "status": display_status,
-            "kind": context.kind if context else "Unknown",
-            "api_version": context.api_version if context else "Unknown",
+            "kind": outcome.kind,
+            "api_version": outcome.api_version,
             "written": False,
             "backup_created": None,
             "healed_content": final_yaml if is_modified else None,
-            "logic_logs": all_logic_logs,
-            "validation_error": validation_error,
+            # Pre-heal text for diff rendering, so callers never re-read the file
+            "original_content": raw_text if is_modified and keep_original else None,
+            "logic_logs": list(outcome.logic_logs),
+            "validation_error": outcome.validation_error,
             "git_warnings": self.check_git_safety(),
             "timestamp": time.time()
         }
 
         # Execution (Disk I/O) with Backup Protection
         if not dry_run and is_modified and (success or (partial_heal and force_write)):
-            backup_path = self._create_unique_backup(full_path)
+            # Write through symlinks to the real file, never over the link
+            full_path = Path(full_path).resolve()
+            backup_path = None
             try:
-                shutil.copy2(full_path, backup_path)
+                try:
+                    # _atomic_write swaps in a new inode, so a hard link keeps
+                    # the original bytes and metadata without copying any data
+                    backup_path = self._create_unique_backup(full_path, link=True)
+                except OSError:
+                    # No hard links here (FAT, some network shares): reserve and copy
+                    backup_path = self._create_unique_backup(full_path)
+                    shutil.copy2(full_path, backup_path)
                 result["backup_created"] = str(backup_path.relative_to(self.workspace))
             except Exception as e:
                 result["backup_warning"] = f"Backup failed: {str(e)}"
+                # Drop the empty placeholder that reserved the name
+                if backup_path is not None:
+                    try:
+                        backup_path.unlink()
+                    except OSError:
+                        pass
             
             try:
                 self._atomic_write(full_path, final_yaml)
@@ -167,16 +486,105 @@ class AuditEngineV3:
             except IOError as e:
                 result["write_error"] = str(e)
                 result["success"] = False
+                # The file was not replaced, so there is nothing to restore,
+                # and a hard-linked backup would only alias the live inode
+                if result["backup_created"] is not None:
+                    try:
+                        backup_path.unlink()
+                    except OSError:
+                        pass
+                    result["backup_created"] = None
         
         return result
 
+    def _stamped_outcome(self, key: tuple, raw_text: str) -> Optional[_HealOutcome]:
+        """The stored outcome for a text an earlier run found already healed."""
+        if self._stamps_fingerprint is None:
+            return None
+        if self._heal_stamps is None:
+            self._heal_stamps = self._read_heal_stamps()
+        stamp = self._heal_stamps.get(key)
+        if stamp is None:
+            return None
+        kind, api_version, logic_logs, validation_error, success, partial_heal = stamp
+        return _HealOutcome(kind, api_version, raw_text, logic_logs, validation_error,
+                            success, partial_heal, False)
+
+    def _stamp(self, key: tuple, outcome: _HealOutcome):
+        """Queues a fixed point (healing changed nothing) for save_heal_stamps."""
+        if self._stamps_fingerprint is not None and not outcome.is_modified:
+            self._new_heal_stamps[key] = (outcome.kind, outcome.api_version, outcome.logic_logs,
+                                          outcome.validation_error, outcome.success, outcome.partial_heal)
+
+    def _read_heal_stamps(self) -> Dict[tuple, tuple]:
+        """Loads the stamp store; a missing, corrupt or foreign store reads as empty."""
+        try:
+            with open(self._stamps_file, 'rb') as f:
+                # Fingerprint first, so a stale store is never fully unpickled
+                if pickle.load(f) == self._stamps_fingerprint:
+                    return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError):
+            pass
+        return {}
+
+    def take_new_heal_stamps(self) -> Dict[tuple, tuple]:
+        """Hands over (and forgets) the stamps queued since the last save or take."""
+        stamps, self._new_heal_stamps = self._new_heal_stamps, {}
+        return stamps
+
+    def add_heal_stamps(self, stamps: Dict[tuple, tuple]):
+        """Queues stamps taken from another engine over the same catalog (a pool worker)."""
+        if self._stamps_fingerprint is not None:
+            self._new_heal_stamps.update(stamps)
+
+    def save_heal_stamps(self):
+        """
+        Merges this engine's new stamps into the user-cache store. Nothing
+        saves implicitly: the caller decides when a batch is done (the CLIs
+        call this after each run), and pool workers hand their stamps back
+        instead of saving (see audit_in_worker). Concurrent saves are
+        serialised by a lock file, so each merges into the previous one's
+        result. Failures are ignored (it is only a cache).
+        """
+        if not self._new_heal_stamps:
+            return
+        new_stamps, self._new_heal_stamps = self._new_heal_stamps, {}
+        stamps_file = self._stamps_file
+        try:
+            stamps_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(stamps_file.with_name(f"{stamps_file.name}.lock"), 'wb') as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                stamps = self._read_heal_stamps()
+                stamps.update(new_stamps)
+                # Oldest entries go first once the store is full
+                for stale in list(itertools.islice(stamps, max(0, len(stamps) - HEAL_STAMPS_LIMIT))):
+                    del stamps[stale]
+                temp_file = stamps_file.with_name(f"{stamps_file.name}.{os.getpid()}.tmp")
+                with open(temp_file, 'wb') as f:
+                    pickle.dump(self._stamps_fingerprint, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(stamps, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_file, stamps_file)
+        except OSError:
+            logger.debug(f"Heal stamps not written to {stamps_file}")
+
     def scan_directory(self, extension: str = ".yaml", dry_run: bool = True, 
                        force_write: bool = False, strict: bool = False, 
                        target_version: str = "v1.31", max_depth: int = 10,
-                       progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
+                       progress_callback: Optional[Callable[[int, int], None]] = None,
+                       jobs: int = 1) -> List[Dict[str, Any]]:
         """
         Recursively discovers and processes all YAML manifests with safety gates.
         Preserves original multi-pattern discovery and symlink protection.
+        With jobs > 1 (e.g. DEFAULT_JOBS), batches of POOL_MIN_FILES or more
+        are audited on a process pool of that many workers; the default
+        jobs=1 stays serial. New heal stamps stay queued until the caller
+        runs save_heal_stamps().
+        Reports always come back in discovery order. A serial scan without
+        a progress_callback (which needs the total up front) audits files
+        as the walk finds them instead of listing the workspace first; the
+        walker hands out a directory's files only after closing its
+        listing, so fixes written meanwhile cannot disturb the walk.
         """
         try:
             max_depth = int(max_depth)
@@ -185,25 +593,39 @@ class AuditEngineV3:
             max_depth = 10
             
         reports = []
-        patterns = [f"*{extension.lower()}", f"*{extension.upper()}"]
-        
-        # Phase 1: File Discovery (Exclude symlinks to prevent loops)
-        all_files = []
-        for p in patterns:
-            all_files.extend([f for f in self.workspace.rglob(p) if f.is_file() and not f.is_symlink()])
+        # Both spellings are matched in one pass; a tuple never double-counts
+        # a file the way one rglob per pattern could
+        patterns = tuple(dict.fromkeys((extension.lower(), extension.upper())))
         
-        total_files = len(all_files)
+        # Phase 1: File Discovery (one lazy scandir walk; symlinks are never
+        # followed and directories beyond max_depth are never opened).
+        # Only enough is read up front to decide between pool and loop,
+        # and nothing at all when no pool was asked for.
+        candidates = iter_yaml_files(str(self.workspace), patterns, max_depth)
+        head = list(itertools.islice(candidates, POOL_MIN_FILES)) if jobs > 1 else []
+        pooled = jobs > 1 and len(head) >= POOL_MIN_FILES and self._worker_initargs is not None
+
+        total_files = 0
+        if pooled or progress_callback:
+            all_files = head + list(candidates)
+            total_files = len(all_files)
+        else:
+            all_files = itertools.chain(head, candidates)
         processed = 0
+        # Every hit lives under the workspace: slice the prefix off
+        # instead of building a relative Path per file
+        cut = len(os.path.join(str(self.workspace), ""))
 
-        # Phase 2: Processing Loop
+        # Phase 2a: Parallel Processing (files share no mutable state)
+        if pooled:
+            return self._scan_in_pool([p[cut:] for p in all_files], jobs, dry_run,
+                                      force_write, strict, target_version, progress_callback)
+
+        # Phase 2b: Serial Processing Loop (one directory fsync per directory)
+        self.defer_directory_syncs()
         for file_path in all_files:
             try:
-                # Recursion depth check
-                rel_parts = file_path.relative_to(self.workspace).parts
-                if len(rel_parts) > max_depth:
-                    continue
-                
-                rel_path = str(file_path.relative_to(self.workspace))
+                rel_path = file_path[cut:]
                 report = self.audit_and_heal_file(
                     rel_path, 
                     dry_run=dry_run, 
@@ -221,25 +643,44 @@ class AuditEngineV3:
             if progress_callback:
                 progress_callback(processed, total_files)
 
+        self.sync_directories()
+        return reports
+
+    def _scan_in_pool(self, rel_paths: List[str], workers: int, dry_run: bool,
+                      force_write: bool, strict: bool, target_version: str,
+                      progress_callback: Optional[Callable[[int, int], None]]) -> List[Dict[str, Any]]:
+        """Fans scan_directory's files out to worker engines (see audit_in_pool)."""
+        total_files = len(rel_paths)
+        on_done = (lambda done, _: progress_callback(done, total_files)) if progress_callback else None
+        reports = audit_in_pool(self, rel_paths, workers, dry_run, force_write, strict,
+                                target_version=target_version, on_done=on_done)
         return reports
 
     def cleanup_backups(self, max_age_hours: int = 168) -> int:
-        """Removes old .kubecuro.backup files (default 7 days)."""
+        """
+        Removes old .kubecuro.backup files (default 7 days).
+        Uses the scandir walker (no depth limit, symlinks not followed,
+        noise directories such as .venv included), so each backup costs
+        one DirEntry stat and one unlink. The walker closes a directory's
+        listing before yielding its files, so unlinking as we go is safe.
+        """
         count = 0
         cutoff = time.time() - (max_age_hours * 3600)
-        for backup in self.workspace.rglob("*.kubecuro.backup"):
+        for backup in iter_matching_entries(self._workspace_prefix, (BACKUP_SUFFIX,), sys.maxsize,
+                                            skip_dirs=frozenset()):
             try:
-                if backup.stat().st_mtime < cutoff:
-                    backup.unlink()
+                if backup.stat(follow_symlinks=False).st_mtime < cutoff:
+                    os.unlink(backup.path)
                     count += 1
             except OSError:
                 continue
         return count
 
-    def generate_summary(self, reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def generate_summary(self, reports: Sequence[Union[AuditReport, Dict[str, Any]]]) -> Dict[str, Any]:
         """
         Provides SRE-style performance metrics.
         Synchronized with main.py wordings: 'Total Manifests', 'Healed/Valid'.
+        Accepts AuditReport rows or raw result dicts.
         """
         if not reports:
             return {
@@ -248,11 +689,24 @@ class AuditEngineV3:
             }
 
         total = len(reports)
-        # Successful includes files that were healed OR already valid
-        successful = sum(1 for r in reports if r.get('success', False))
-        writes = sum(1 for r in reports if r.get('written', False))
-        backups_count = sum(1 for r in reports if r.get('backup_created') is not None)
-        system_errors = sum(1 for r in reports if r.get('status') == "ENGINE_ERROR")
+        successful = writes = backups_count = system_errors = 0
+        # One pass over the batch; dicts are read in place, not converted
+        for r in reports:
+            if isinstance(r, AuditReport):
+                success, written, backup, status = r.success, r.written, r.backup_created, r.status
+            else:
+                success, written, backup, status = (
+                    r.get("success"), r.get("written"), r.get("backup_created"), r.get("status")
+                )
+            # Successful includes files that were healed OR already valid
+            if success:
+                successful += 1
+            if written:
+                writes += 1
+            if backup is not None:
+                backups_count += 1
+            if status == "ENGINE_ERROR":
+                system_errors += 1
         
         return {
             "total_files": total,
@@ -272,38 +726,151 @@ class AuditEngineV3:
         return "PARTIAL" if partial else "FAILED"
 
     def _atomic_write(self, target_path: Path, content: str):
-        """Ensures data integrity by writing to a temporary file before renaming."""
-        if not os.access(target_path.parent, os.W_OK):
-            raise PermissionError(f"No write access to {target_path.parent}")
-        temp_file = target_path.with_suffix('.kubecuro.tmp')
+        """
+        Ensures data integrity by writing to a temporary file before renaming.
+        The temp name is unique per call (mkstemp), its data is fsynced
+        before the rename, and the directory entry is fsynced after it.
+        """
+        data = content.encode('utf-8')
+        directory = str(target_path.parent)
+        temp_file = None
         try:
-            temp_file.write_text(content, encoding='utf-8')
+            fd, temp_file = tempfile.mkstemp(prefix=f".{target_path.stem}.", suffix=".kubecuro.tmp", dir=directory)
+            try:
+                # mkstemp creates 0600; keep the manifest's own permissions
+                if hasattr(os, "fchmod"):
+                    os.fchmod(fd, stat.S_IMODE(os.stat(target_path).st_mode))
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
             os.replace(temp_file, target_path)
+            temp_file = None
         except Exception as e:
-            if temp_file.exists(): temp_file.unlink()
+            if temp_file is not None and os.path.exists(temp_file):
+                os.unlink(temp_file)
             raise IOError(f"Atomic write failed: {str(e)}")
 
-    def _create_unique_backup(self, target_path: Path) -> Path:
-        """Creates unique backup names to avoid overwriting previous snapshots."""
-        backup_path = target_path.with_suffix('.kubecuro.backup')
-        counter = 1
-        while backup_path.exists():
-            backup_path = target_path.with_name(f"{target_path.stem}-{counter}.kubecuro.backup")
-            counter += 1
+        # Persist the rename itself, now or once per directory in batch mode
+        if self._deferred_dir_syncs is not None:
+            self._deferred_dir_syncs.add(directory)
+        else:
+            self._fsync_directory(directory)
+
+    def defer_directory_syncs(self):
+        """
+        Batch mode: writes still fsync their data before the rename, but the
+        directory fsync that makes renames durable waits for sync_directories,
+        so a batch pays one per directory instead of one per file.
+        """
+        if self._deferred_dir_syncs is None:
+            self._deferred_dir_syncs = set()
+
+    def sync_directories(self):
+        """Fsyncs every directory written to since batch mode began, and ends it."""
+        pending, self._deferred_dir_syncs = self._deferred_dir_syncs, None
+        for directory in sorted(pending or ()):
+            self._fsync_directory(directory)
+
+    @staticmethod
+    def _fsync_directory(directory: str):
+        """Persists a directory's entries (POSIX); best effort only."""
+        if os.name == "posix":
+            try:
+                dir_fd = os.open(directory, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except OSError:
+                pass
+
+    def _create_unique_backup(self, target_path: Path, link: bool = False) -> Path:
+        """
+        Creates unique backup names to avoid overwriting previous snapshots.
+        Existing backups are indexed with one scandir per directory; names
+        are then reserved with O_CREAT|O_EXCL, so concurrent workers never
+        hand out the same name and no exists() probing loop is needed.
+        With link=True the name is claimed by hard-linking target_path to
+        it (equally exclusive); errors other than a taken name propagate.
+        """
+        taken = self._backup_counters.get(str(target_path.parent))
+        if taken is None:
+            taken = self._backup_counters[str(target_path.parent)] = self._scan_backups(target_path.parent)
+
+        stem = target_path.stem
+        index = taken[stem] + 1 if stem in taken else 0
+        while True:
+            name = f"{stem}-{index}{BACKUP_SUFFIX}" if index else f"{stem}{BACKUP_SUFFIX}"
+            backup_path = target_path.with_name(name)
+            try:
+                if link:
+                    os.link(target_path, backup_path)
+                else:
+                    os.close(os.open(backup_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+                break
+            except FileExistsError:
+                index += 1
+        taken[stem] = index
         return backup_path
 
+    @staticmethod
+    def _scan_backups(directory: Path) -> Dict[str, int]:
+        """Highest backup index per stem among a directory's existing backups."""
+        taken: Dict[str, int] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(BACKUP_SUFFIX):
+                        continue
+                    core = entry.name[:-len(BACKUP_SUFFIX)]
+                    # "app-1" may be the unnumbered backup of app-1.yaml or
+                    # backup 1 of app.yaml; recording both is always safe
+                    taken[core] = max(taken.get(core, 0), 0)
+                    numbered = _NUMBERED_BACKUP.fullmatch(core)
+                    if numbered:
+                        stem, index = numbered.group(1), int(numbered.group(2))
+                        taken[stem] = max(taken.get(stem, 0), index)
+        except OSError:
+            pass
+        return taken
+
     def check_git_safety(self) -> List[str]:
-        """Detects if KubeCuro temporary files are properly ignored in Git."""
-        warnings = []
+        """
+        Detects if KubeCuro temporary files are properly ignored in Git.
+        Called once per manifest, so the answer is cached until the
+        .gitignore changes (one stat per call instead of a read and scan).
+        """
         gitignore = self.workspace / ".gitignore"
-        if (self.workspace / ".git").exists() and gitignore.exists():
-            try:
-                content = gitignore.read_text(encoding='utf-8', errors='ignore')
-                for ext in ["*.kubecuro.backup", "*.kubecuro.tmp"]:
-                    if ext not in content:
-                        warnings.append(f"Add '{ext}' to .gitignore")
-            except: pass
-        return warnings
+        try:
+            st = gitignore.stat()
+        except OSError:
+            return []
+        key = (st.st_mtime_ns, st.st_size)
+        if self._git_warnings_cache is None or self._git_warnings_cache[0] != key:
+            warnings = ()
+            if (self.workspace / ".git").exists():
+                try:
+                    raw = gitignore.read_bytes()
+                    warnings = tuple(f"Add '{ext}' to .gitignore" for ext, needle in _GIT_IGNORE_BYTES if needle not in raw)
+                except OSError:
+                    pass
+            self._git_warnings_cache = (key, warnings)
+        return list(self._git_warnings_cache[1])
+
+    def _not_kubernetes(self, path: str) -> Dict[str, Any]:
+        """Report for non-K8s YAML, which is left alone without running the pipeline."""
+        return {
+            "file_path": path, "success": True, "partial_heal": False,
+            "status": "NOT_K8S", "kind": None, "api_version": None,
+            "written": False, "backup_created": None,
+            "healed_content": None, "original_content": None,
+            "logic_logs": ["Skipped: no apiVersion or kind key, not a Kubernetes manifest."],
+            "validation_error": "",
+            "git_warnings": self.check_git_safety(), "timestamp": time.time()
+        }
 
     def _file_error(self, path: str, status: str, error: str) -> Dict[str, Any]:
         """Generates a failure report entry for files that couldn't be processed."""
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+KUBECURO FILESYSTEM - Manifest Discovery & Ingestion
+----------------------------------------------------
+Locates candidate manifests beneath a workspace using a single
+os.scandir pass per directory. DirEntry type checks are answered from
+the directory listing itself, so discovery costs no extra stat() calls.
+
+Author: Nishar A Sunkesala / KubeCuro Team
+Date: 2026-10-15
+"""
+
+import functools
+import mmap
+import os
+import sys
+from typing import FrozenSet, Iterator, List, Optional, Tuple, Union
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# Manifests above this size are refused instead of read into memory
+MAX_MANIFEST_BYTES = 16 * 1024 * 1024
+
+# From this size on, manifests are decoded straight from a read-only
+# mapping instead of first being copied into a bytes object
+MMAP_MIN_BYTES = 1024 * 1024
+
+class ManifestTooLarge(ValueError):
+    """Raised by read_yaml_text for files larger than the size cap."""
+
+# O_BINARY only exists (and matters) on Windows
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+# Workspaces that are never healed in bulk: the filesystem root and $HOME
+FORBIDDEN_ROOTS = frozenset({
+    os.path.realpath(os.sep),
+    os.path.realpath(os.path.expanduser("~")),
+})
+
+def is_forbidden_root(path: Union[str, os.PathLike]) -> bool:
+    """
+    True when path is the filesystem root or the user's home directory.
+    Expects an already-resolved path (the CLIs resolve their input).
+    """
+    return os.fspath(path) in FORBIDDEN_ROOTS
+
+# VCS internals, dependency trees and caches: never manifests, often huge
+NOISE_DIRS = frozenset({".git", "node_modules", ".venv", "__pycache__"})
+
+CATALOG_FILE = "k8s_v1_distilled.json"
+
+@functools.lru_cache(maxsize=1)
+def find_catalog() -> str:
+    """
+    Locates the K8s schema catalog shared by both CLIs. The answer is
+    constant for the life of the process, so the search runs once;
+    tests can reset it via find_catalog.cache_clear().
+    Raises FileNotFoundError when no candidate exists.
+    """
+    package_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    search_locations = [
+        os.path.join(package_dir, "cli", "catalog", CATALOG_FILE),
+        os.path.join(package_dir, "catalog", CATALOG_FILE),
+        os.path.join(os.path.dirname(package_dir), "catalog", CATALOG_FILE),
+        os.path.join("catalog", CATALOG_FILE),  # Local development fallback
+    ]
+    if hasattr(sys, '_MEIPASS'):
+        search_locations.insert(0, os.path.join(sys._MEIPASS, "catalog", CATALOG_FILE))
+
+    for candidate in search_locations:
+        if os.path.isfile(candidate):
+            return candidate
+    raise FileNotFoundError(f"{CATALOG_FILE} not found in any catalog location")
+
+def iter_yaml_files(root: str, exts: Tuple[str, ...], max_depth: int,
+                    skipped: Optional[List[str]] = None,
+                    unreadable: Optional[List[str]] = None,
+                    follow_symlinks: bool = False,
+                    skip_dirs: FrozenSet[str] = NOISE_DIRS) -> Iterator[str]:
+    """
+    Yields the paths of the manifests under root whose names end with
+    one of exts; see iter_matching_entries for the walk itself.
+    """
+    for entry in iter_matching_entries(root, exts, max_depth, skipped, unreadable,
+                                       follow_symlinks, skip_dirs):
+        yield entry.path
+
+def iter_matching_entries(root: str, suffixes: Tuple[str, ...], max_depth: int,
+                          skipped: Optional[List[str]] = None,
+                          unreadable: Optional[List[str]] = None,
+                          follow_symlinks: bool = False,
+                          skip_dirs: FrozenSet[str] = NOISE_DIRS) -> Iterator[os.DirEntry]:
+    """
+    Yields the DirEntry of each regular file under root whose name ends
+    with one of suffixes; callers that need a file's metadata call
+    entry.stat() instead of stat()ing the path again.
+    Directories deeper than max_depth are never opened, and
+    a directory reached twice (bind mounts, followed links) is only
+    walked once, keyed by its (st_dev, st_ino). Subdirectories named in
+    skip_dirs are never entered (root itself is always walked).
+
+    By default symlinks are never followed. With follow_symlinks, links
+    whose target resolves inside root are walked (directories) or
+    yielded under the link's own path (files); links escaping root or
+    dangling are treated like any other skipped entry.
+
+    Depth is counted like relative path parts: files directly inside
+    root are at depth 1. Matching names that are not regular files
+    (symlinks, sockets) are appended to `skipped` when it is provided.
+    Directories that could not be opened are appended to `unreadable`.
+
+    A directory's hits are only yielded once its listing is closed, so
+    callers may write into it (temp files, backups, renames) while they
+    consume the walk without readdir skipping or repeating entries.
+    """
+    root_prefix = os.path.join(os.path.realpath(root), "") if follow_symlinks else ""
+    visited = set()
+    # Explicit stack of (directory, depth) instead of recursion
+    stack = [(root, 1)]
+    while stack:
+        path, depth = stack.pop()
+        hits = []
+        try:
+            st = os.stat(path)
+            if (st.st_dev, st.st_ino) in visited:
+                continue
+            visited.add((st.st_dev, st.st_ino))
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if depth < max_depth and entry.name not in skip_dirs:
+                            stack.append((entry.path, depth + 1))
+                    elif follow_symlinks and entry.is_symlink():
+                        # realpath is only paid on symlink hits
+                        target = os.path.realpath(entry.path)
+                        if not target.startswith(root_prefix):
+                            if skipped is not None and entry.name.endswith(suffixes):
+                                skipped.append(entry.path)
+                        elif os.path.isdir(target):
+                            if depth < max_depth and entry.name not in skip_dirs:
+                                stack.append((entry.path, depth + 1))
+                        elif depth <= max_depth and entry.name.endswith(suffixes):
+                            if os.path.isfile(target):
+                                hits.append(entry)
+                            elif skipped is not None:
+                                skipped.append(entry.path)
+                    elif depth <= max_depth and entry.name.endswith(suffixes):
+                        if entry.is_file(follow_symlinks=False):
+                            hits.append(entry)
+                        elif skipped is not None:
+                            skipped.append(entry.path)
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            # Unreadable or vanished directories are skipped, as rglob did,
+            # but recorded so the CLI can say the scan was incomplete
+            if unreadable is not None:
+                unreadable.append(path)
+        yield from hits
+
+def read_yaml_text(path: Union[str, os.PathLike], max_bytes: int = MAX_MANIFEST_BYTES) -> str:
+    """
+    Reads a manifest as UTF-8, dropping a leading BOM if present.
+    Equivalent to read_text(encoding='utf-8-sig') without the buffered
+    file object and incremental BOM-sniffing decoder per file. Files of
+    MMAP_MIN_BYTES or more are decoded from a read-only mmap.
+    Raises ManifestTooLarge rather than reading more than max_bytes.
+    """
+    fd = os.open(path, _READ_FLAGS)
+    try:
+        size = os.fstat(fd).st_size
+        if size > max_bytes:
+            raise ManifestTooLarge(f"{size} bytes exceeds the {max_bytes}-byte manifest limit")
+        if size >= MMAP_MIN_BYTES:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                return _decode_utf8(mapped)
+        # One read sized from fstat covers a regular file; keep reading to
+        # EOF in case it grew meanwhile or reports no size (procfs, FIFOs)
+        chunks = [os.read(fd, size + 1)]
+        total = len(chunks[0])
+        while chunks[-1]:
+            if total > max_bytes:
+                raise ManifestTooLarge(f"more than {max_bytes} bytes (manifest limit)")
+            chunks.append(os.read(fd, 65536))
+            total += len(chunks[-1])
+    finally:
+        os.close(fd)
+    return _decode_utf8(chunks[0] if len(chunks) == 2 else b"".join(chunks))
+
+def _decode_utf8(buf) -> str:
+    """Decodes a bytes-like buffer as UTF-8; a leading BOM is skipped, not sliced off by copy."""
+    with memoryview(buf) as view:
+        with view[3 if view[:3] == UTF8_BOM else 0:] as body:
+            return str(body, 'utf-8')
@@ -9,16 +9,21 @@ Author: Nishar A Sunkesala / KubeCuro Team
 Date: 2026-01-16
 """
 
-from dataclasses import dataclass
-from typing import Optional, Any
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
 
-@dataclass
+# __slots__ via the dataclass decorator needs Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class Shard:
     """
     The atomic unit of a Kubernetes manifest.
     
     A Shard represents a single logical line or key-value pair extracted 
-    from the raw YAML text during the Lexing phase.
+    from the raw YAML text during the Lexing phase. One is built per
+    line, so instances are slotted (no per-object __dict__) where supported.
     """
     line_no: int            # The original line number in the source file
     indent: int             # The calculated indentation depth (whitespace count)
@@ -27,3 +32,28 @@ class Shard:
     is_list_item: bool = False   # True if the line starts with a '-' indicator
     comment: Optional[str] = None # Captures inline or end-of-line # comments
     raw_line: str = ""      # The original unmutated string for recovery/debugging
+
+@dataclass(**_SLOTS)
+class AuditReport:
+    """
+    The per-file row kept for the final report table and summary.
+
+    Built from the engine's result dict once any diff output has been
+    shown; the healed/original text is not carried over.
+    """
+    file_path: str
+    status: str
+    kind: str = "Unknown"
+    success: bool = False
+    partial_heal: bool = False
+    written: bool = False
+    backup_created: Optional[str] = None
+    error: Optional[str] = None
+    git_warnings: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> "AuditReport":
+        """Picks the row fields out of an engine result dict."""
+        return cls(**{name: result[name] for name in _REPORT_FIELDS if result.get(name) is not None})
+
+_REPORT_FIELDS = tuple(f.name for f in fields(AuditReport))
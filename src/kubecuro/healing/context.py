@@ -22,6 +22,7 @@ class HealContext:
     the Lexer, Scanner, and Structurer sequentially.
     """
     raw_text: str                          # The initial raw input from the user
+    lines: List[str] = field(default_factory=list) # raw_text split into lines, once
     shards: List[Shard] = field(default_factory=list) # List of processed Shard objects
     shadow_map: Any = None                 # Reference to the KubeShadow positioning map
     kind: Optional[str] = None             # The detected K8s Kind (e.g., Deployment)
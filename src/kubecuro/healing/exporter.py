@@ -25,6 +25,8 @@ class KubeExporter:
         self.yaml.indent(mapping=2, sequence=4, offset=2)
         self.yaml.width = 4096 
         self.preferred_order = ["apiVersion", "kind", "metadata", "spec", "data", "status"]
+        # key -> sort rank, so ordering a map never scans the lists above
+        self._preferred_rank = {key: rank for rank, key in enumerate(self.preferred_order)}
 
     def _get_sorted_map(self, data: Any) -> Any:
         """
@@ -34,20 +36,20 @@ class KubeExporter:
             return data
 
         sorted_map = CommentedMap()
+        # Comment attributes are resolved once per map, not once per key
+        source_items = data.ca.items
+        target_items = sorted_map.ca.items
         
         # 1. Preserve Header Comments
-        if hasattr(data, 'ca') and data.ca.comment:
+        if data.ca.comment:
             sorted_map.ca.comment = data.ca.comment
 
-        # 2. Key Sorting Logic
-        keys = list(data.keys())
-        def sort_logic(key):
-            if key in self.preferred_order:
-                return self.preferred_order.index(key)
-            # Unknown keys keep their relative original position
-            return len(self.preferred_order) + keys.index(key)
-        
-        sorted_keys = sorted(keys, key=sort_logic)
+        # 2. Key Sorting Logic: preferred keys by rank, unknown keys keep
+        # their relative original position (one dict lookup per key)
+        rank = self._preferred_rank
+        tail = len(rank)
+        sorted_keys = [key for _, key in sorted(
+            (rank.get(key, tail + pos), key) for pos, key in enumerate(data))]
 
         # 3. Recursive Rebuild
         for key in sorted_keys:
@@ -62,8 +64,8 @@ class KubeExporter:
             sorted_map[key] = value
             
             # 4. Transfer Comment Metadata (EOL and Inline)
-            if hasattr(data, 'ca') and key in data.ca.items:
-                sorted_map.ca.items[key] = data.ca.items[key]
+            if key in source_items:
+                target_items[key] = source_items[key]
 
         return sorted_map
 
@@ -9,10 +9,115 @@ Author: Nishar A Sunkesala / KubeCuro Team
 Date: 2026-01-16
 """
 
+import functools
 import re
+import string
 from typing import List, Tuple, Any, Optional
 from kubecuro.core.models import Shard
 
+# The only characters that can change the comment-split state machine
+_COMMENT_TOKENS = re.compile(r"""[\\"'#]""")
+# Lines with an image reference are exempt from the stuck-colon fix
+_IMAGE_VALUE = re.compile(r'image[:\s]*[a-zA-Z0-9/]')
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+def _space_stuck_colons(code: str) -> str:
+    """
+    Fixes "kind:Pod" -> "kind: Pod" while leaving http:/https: alone.
+    A str.find scan equivalent to
+    re.sub(r'(?<!http)(?<!https):(?!\s)([a-zA-Z])', r': \1', code).
+    """
+    parts = []
+    start = 0
+    i = code.find(':')
+    while i != -1:
+        if (code[i + 1:i + 2] in _ASCII_LETTERS and code[max(i - 4, 0):i] != 'http'
+                and code[max(i - 5, 0):i] != 'https'):
+            parts.append(code[start:i + 1])
+            parts.append(' ')
+            start = i + 1
+        i = code.find(':', i + 1)
+    if not parts:
+        return code
+    parts.append(code[start:])
+    return ''.join(parts)
+
+def find_comment_split(text: str) -> int:
+    """
+    Index of the '#' that starts a comment, or -1. Hashes inside quotes,
+    escaped ones, and ones glued to a value (url#anchor) do not count.
+    Most lines carry no '#' at all and return straight away; the rest
+    jump between quote/escape/hash characters via a compiled regex
+    (C speed) instead of stepping through every character.
+    """
+    if '#' not in text:
+        return -1
+    if '"' not in text and "'" not in text and '\\' not in text:
+        # No quote or escape state to track: hop between hashes with str.find
+        i = text.find('#')
+        while i > 0 and not text[i-1].isspace():
+            i = text.find('#', i + 1)
+        return i
+    in_double_quote = in_single_quote = False
+    escaped_at = -1
+    for match in _COMMENT_TOKENS.finditer(text):
+        i = match.start()
+        # A backslash swallows the next character, whatever it is
+        if i == escaped_at: continue
+        char = text[i]
+        if char == '\\': escaped_at = i + 1; continue
+        if char == '"' and not in_single_quote: in_double_quote = not in_double_quote
+        elif char == "'" and not in_double_quote: in_single_quote = not in_single_quote
+        if char == '#' and not in_double_quote and not in_single_quote:
+            if i == 0 or text[i-1].isspace(): return i
+    return -1
+
+@functools.lru_cache(maxsize=4096)
+def _repair_line_cached(line: str, in_block: bool,
+                        block_indent: int) -> Tuple[int, str, Optional[str], bool, int]:
+    """
+    Pure core of KubeLexer.repair_line: returns (indent, code, comment)
+    plus the block state that follows the line. Blank lines, "- name:"
+    entries and repeated env/port stanzas recur constantly in rendered
+    charts, so results are cached across lines and files.
+    """
+    # 1. Cleaning & Tabs (the memchr-level 'in' test spares tab-free lines the replace call)
+    raw_line = (line.replace('\t', '  ') if '\t' in line else line).rstrip()
+    content = raw_line.lstrip()
+    if not content:
+        return 0, "", "", in_block, block_indent
+
+    indent = len(raw_line) - len(content)
+
+    # 2. Block Protection (Case 12/13)
+    if in_block:
+        if indent <= block_indent and (':' in content or content.startswith('-')):
+            in_block = False
+        else:
+            return indent, content, "", in_block, block_indent
+
+    # 3. Comment Separation
+    split_idx = find_comment_split(raw_line)
+    code_part = raw_line[:split_idx] if split_idx != -1 else raw_line
+    comment_part = raw_line[split_idx:].lstrip('# ') if split_idx != -1 else None
+
+    # 4. Surgical Fixes (Stuck Dash/Colon)
+    code_part = code_part.lstrip()
+    # Fix "-image" -> "- image"
+    if code_part.startswith('-') and len(code_part) > 1 and code_part[1].isalpha():
+        code_part = "- " + code_part[1:]
+
+    # Fix "kind:Pod" -> "kind: Pod" (Protecting URLs/Image tags)
+    if ':' in code_part and not ('image' in code_part and _IMAGE_VALUE.search(code_part)):
+        code_part = _space_stuck_colons(code_part)
+
+    # 5. Update Block State ('|-' and '>-' contain '|' and '>')
+    if '|' in code_part or '>' in code_part:
+        in_block = True
+        block_indent = indent
+
+    return indent, code_part, comment_part, in_block, block_indent
+
 class KubeLexer:
     """
     Orchestrates the transition from raw text to semantic Shards.
@@ -20,29 +125,16 @@ class KubeLexer:
     """
 
     def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clears the block state so the instance can shard another file."""
         self.in_block = False
         self.block_indent = 0
 
-    def _clean_artifacts(self, text: str) -> str:
-        """
-        Removes invisible UTF-8 BOM markers and standardized line endings.
-        """
-        # Remove Byte Order Mark if present
-        text = text.lstrip('\ufeff')
-        # Standardize CRLF to LF
-        return text.replace('\r\n', '\n')
-
     def _find_comment_split(self, text: str) -> int:
-        """Protects quotes and # symbols inside values."""
-        in_double_quote = in_single_quote = escaped = False
-        for i, char in enumerate(text):
-            if escaped: escaped = False; continue
-            if char == '\\': escaped = True; continue
-            if char == '"' and not in_single_quote: in_double_quote = not in_double_quote
-            elif char == "'" and not in_double_quote: in_single_quote = not in_single_quote
-            if char == '#' and not in_double_quote and not in_single_quote:
-                if i == 0 or text[i-1].isspace(): return i
-        return -1
+        """Protects quotes and # symbols inside values (see find_comment_split)."""
+        return find_comment_split(text)
 
     def _extract_semantics(self, code_part: str) -> Tuple[str, Optional[Any], bool]:
         """
@@ -53,13 +145,14 @@ class KubeLexer:
         if not clean:
             return "", None, False
             
-        is_list = clean.startswith('-')
+        is_list = clean[0] == '-'
         if is_list:
             clean = clean[1:].lstrip()
             
-        if ':' in clean:
+        # One partition both finds and splits on the first colon
+        key_part, colon, val_part = clean.partition(':')
+        if colon:
             # Handle standard key: value pairs
-            key_part, _, val_part = clean.partition(':')
             return key_part.strip(), val_part.strip() or None, is_list
         
         # If no colon, treat the whole part as a value (list scalar or partial)
@@ -68,61 +161,32 @@ class KubeLexer:
     def repair_line(self, line: str) -> Tuple[int, str, str]:
         """
         Surgically repairs a line and returns (indent, code, comment).
+        The work is memoized on (line, block state); see _repair_line_cached.
         """
-        # 1. Cleaning & Tabs
-        raw_line = line.replace('\t', '  ').rstrip()
-        content = raw_line.lstrip()
-        if not content:
-            return 0, "", ""
-        
-        indent = len(raw_line) - len(content)
-
-        # 2. Block Protection (Case 12/13)
-        if self.in_block:
-            if indent <= self.block_indent and (':' in content or content.startswith('-')):
-                self.in_block = False
-            else:
-                return indent, content, ""
-
-        # 3. Comment Separation
-        split_idx = self._find_comment_split(raw_line)
-        code_part = raw_line[:split_idx] if split_idx != -1 else raw_line
-        comment_part = raw_line[split_idx:].lstrip('# ') if split_idx != -1 else None
-
-        # 4. Surgical Fixes (Stuck Dash/Colon)
-        code_part = code_part.lstrip()
-        # Fix "-image" -> "- image"
-        if code_part.startswith('-') and len(code_part) > 1 and code_part[1].isalpha():
-            code_part = "- " + code_part[1:]
-        
-        # Fix "kind:Pod" -> "kind: Pod" (Protecting URLs/Image tags)
-        if not re.search(r'image[:\s]*[a-zA-Z0-9/]', code_part):
-            code_part = re.sub(r'(?<!http)(?<!https):(?!\s)([a-zA-Z])', r': \1', code_part)
-
-        # 5. Update Block State
-        if any(marker in code_part for marker in ['|', '>', '|-', '>-']):
-            self.in_block = True
-            self.block_indent = indent
-
-        return indent, code_part, comment_part
+        indent, code, comment, self.in_block, self.block_indent = _repair_line_cached(
+            line, self.in_block, self.block_indent)
+        return indent, code, comment
 
     def shard(self, raw_yaml: str) -> List[Shard]:
         """
         Decomposes raw YAML string into a List of Shard models.
         This is the primary interface for the HealingPipeline.
         """
-        clean_yaml = self._clean_artifacts(raw_yaml)
-        self.in_block = False
-        lines = raw_yaml.splitlines()
+        self.reset()
+        # Invisible BOM markers are dropped up front; splitlines() already
+        # ends lines at CRLF, so no separate line-ending pass is needed
+        lines = raw_yaml.lstrip('\ufeff').splitlines()
         shards = []
+        prev_line = None
 
         for i, original_line in enumerate(lines):
             working_line = original_line
             
-            # Flush-Left Recovery Logic
-            if i > 0 and lines[i-1].rstrip().endswith(':') and working_line.startswith('-'):
-                p_indent = len(lines[i-1]) - len(lines[i-1].lstrip())
+            # Flush-Left Recovery Logic (the cheap dash test runs first)
+            if working_line.startswith('-') and prev_line and prev_line.rstrip().endswith(':'):
+                p_indent = len(prev_line) - len(prev_line.lstrip())
                 working_line = (' ' * (p_indent + 2)) + working_line
+            prev_line = original_line
             
             indent, code, comment = self.repair_line(working_line)
             key, value, is_list = self._extract_semantics(code)
@@ -28,6 +28,10 @@ class HealingPipeline:
     """
     The Orchestrator: Ensures that lexical repair, metadata capture, 
     and intent extraction happen in a strictly defined order.
+
+    The stage objects are built once and reused for every file. Each
+    stateful stage (lexer, scanner, shadow) resets itself on entry, so
+    nothing carries over between files; the structurer is stateless.
     """
 
     def __init__(self, catalog: dict):
@@ -56,18 +60,21 @@ class HealingPipeline:
         # Reconstruct cleaned text from shards for the shadow map.
         # This ensures the 'Shadow' sees the text exactly as the Lexer repaired it,
         # ensuring UTF-8 BOM/artifacts removed during sharding are reflected.
-        cleaned_text = "\n".join([s.raw_line for s in shards])
+        # The line list is kept and handed to Shadow and Scanner, so neither
+        # has to split the text again.
+        lines = [s.raw_line for s in shards]
+        cleaned_text = "\n".join(lines)
 
         # --- PHASE 2: SHADOW CAPTURE ---
         # Captures the original formatting state (indentation patterns, comment placement)
         # so that the Structurer can re-apply 'flavor' to the final output.
-        self.shadow.capture(cleaned_text)
+        self.shadow.capture(cleaned_text, lines=lines)
 
         # --- PHASE 3: INTENT EXTRACTION (SCANNING) ---
         # The scanner identifies the 'Identity' of the manifest (Kind/APIVersion).
         # We capture found_shards to maintain compatibility with the Scanner API,
         # though we prioritize the Lexer's shards for the final context.
-        found_shards = self.scanner.scan(cleaned_text) 
+        found_shards = self.scanner.scan(cleaned_text, lines=lines)
         kind, api = self.scanner.get_identity()
 
         # --- PHASE 4: INITIALIZATION OF CONTEXT ---
@@ -75,6 +82,7 @@ class HealingPipeline:
         # It carries all state discovered during diagnostic phases.
         context = HealContext(
             raw_text=cleaned_text,
+            lines=lines,
             shards=shards, # Pass the shards generated in Phase 1
             shadow_map=self.shadow,
             kind=kind,
@@ -25,29 +25,32 @@ class KubeScanner:
     
     def __init__(self):
         # State tracking for the manifest identity
+        self.reset()
+
+    def reset(self):
+        """Forgets the identity found in the previous file."""
         self.found_kind: Optional[str] = None
         self.found_api: Optional[str] = None
 
-    def scan(self, raw_text: str) -> List[Shard]:
+    def scan(self, raw_text: str, lines: Optional[List[str]] = None) -> List[Shard]:
         """
         Processes text into Shards using established regex patterns.
-        Ensures alignment with the current models.py.
+        Ensures alignment with the current models.py. Callers that already
+        hold raw_text split into lines pass them to skip the split.
         """
         # --- RESET GATE ---
         # Ensures batch processing doesn't leak 'Kind' from previous files
-        self.found_kind = None
-        self.found_api = None
+        self.reset()
         
         shards = []
-        lines = raw_text.splitlines()
+        if lines is None:
+            lines = raw_text.splitlines()
         
+        match_line = self.LINE_PATTERN.match
         for i, line in enumerate(lines, 1):
-            # 1. Skip logic (Shadow.py handles comments/blanks)
-            stripped = line.strip()
-            if not stripped or stripped.startswith('#'):
-                continue
-
-            match = self.LINE_PATTERN.match(line)
+            # Blank and comment lines never match (keys cannot start with '#'),
+            # so the skip check only runs on lines the pattern missed
+            match = match_line(line)
             if match:
                 indent_str, list_prefix, key, value = match.groups()
                 
@@ -70,6 +73,10 @@ class KubeScanner:
                     raw_line=line
                 ))
             else:
+                # 1. Skip logic (Shadow.py handles comments/blanks)
+                stripped = line.strip()
+                if not stripped or stripped.startswith('#'):
+                    continue
                 # Restored: Logic for lines that aren't key:value (like list scalars)
                 shards.append(self._handle_anomaly(i, line))
                 
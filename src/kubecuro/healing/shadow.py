@@ -14,6 +14,7 @@ Date: 2026-01-16
 
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
+from kubecuro.healing.lexer import find_comment_split
 
 @dataclass
 class ShadowMetadata:
@@ -29,6 +30,10 @@ class KubeShadow:
     that aren't functional data but are vital for human maintenance.
     """
     def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Drops the previous file's comments before the next capture."""
         # Maps original line numbers to their respective metadata
         self.comment_map: Dict[int, ShadowMetadata] = {}
         # Stores comments found at the very end of a file with no data line following
@@ -39,32 +44,21 @@ class KubeShadow:
         Identifies the true start of a comment, protecting hashes 
         wrapped in quotes. Matches the Lexer's surgical logic.
         """
-        in_double = in_single = escaped = False
-        for i, char in enumerate(text):
-            if escaped:
-                escaped = False
-                continue
-            if char == '\\':
-                escaped = True
-                continue
-            if char == '"' and not in_single:
-                in_double = not in_double
-            elif char == "'" and not in_double:
-                in_single = not in_single
-            if char == '#' and not in_double and not in_single:
-                # Valid YAML comments require a leading space if not at start
-                if i == 0 or text[i-1].isspace():
-                    return i
-        return -1
+        return find_comment_split(text)
 
-    def capture(self, raw_text: str):
+    def capture(self, raw_text: str, lines: Optional[List[str]] = None):
         """
         Scans the repaired text to map comments to their logical data lines.
         
         Args:
             raw_text: The string output from the Lexer repair phase.
+            lines: raw_text already split into lines, if the caller has them.
         """
-        lines = raw_text.splitlines()
+        # The pipeline reuses one shadow per engine: line numbers from the
+        # last file must not carry its comments into this one
+        self.reset()
+        if lines is None:
+            lines = raw_text.splitlines()
         pending_comments = []
 
         for i, line in enumerate(lines, 1):
@@ -81,7 +75,8 @@ class KubeShadow:
 
             # 3. Data Line Association & Inline Capture
             inline_part = None
-            comment_idx = self._find_safe_comment_idx(line)
+            # Most data lines carry no '#': skip the quote-aware scan outright
+            comment_idx = self._find_safe_comment_idx(line) if '#' in line else -1
             
             if comment_idx != -1:
                 inline_part = line[comment_idx:].strip()
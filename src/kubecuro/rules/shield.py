@@ -13,6 +13,15 @@ Date: 2026-01-16
 from typing import Dict, Any, List, Tuple
 from ruamel.yaml.comments import CommentedMap
 
+# Resources that should NOT have a namespace (Cluster-scoped)
+CLUSTER_SCOPED_KINDS = frozenset({
+    "Namespace", "Node", "ClusterRole", "ClusterRoleBinding",
+    "StorageClass", "PersistentVolume", "CustomResourceDefinition"
+})
+
+# Workloads whose pod template containers must carry resource limits
+WORKLOAD_KINDS = frozenset({"Deployment", "StatefulSet", "Job", "DaemonSet", "ReplicaSet"})
+
 class ShieldEngine:
     """
     The 'Shield' Logic Library: 
@@ -52,18 +61,24 @@ class ShieldEngine:
         
         return doc, changes
 
+    def protect_batch(self, docs: List[Any]) -> Tuple[List[Any], List[str]]:
+        """
+        Protects every document of a manifest in one call.
+        Returns the protected documents and the combined change log.
+        """
+        protected, changes = [], []
+        for doc in docs:
+            doc, logs = self.protect(doc)
+            protected.append(doc)
+            changes.extend(logs)
+        return protected, changes
+
     def _rule_ensure_namespace(self, doc: Any) -> Tuple[Any, str]:
         """
         Policy: Every namespaced resource must have an explicit namespace.
         """
         kind = doc.get("kind", "")
-        # Resources that should NOT have a namespace (Cluster-scoped)
-        cluster_scoped = [
-            "Namespace", "Node", "ClusterRole", "ClusterRoleBinding", 
-            "StorageClass", "PersistentVolume", "CustomResourceDefinition"
-        ]
-        
-        if not kind or kind in cluster_scoped:
+        if not kind or kind in CLUSTER_SCOPED_KINDS:
             return doc, ""
 
         if "metadata" not in doc:
@@ -83,9 +98,7 @@ class ShieldEngine:
         Policy: Workloads must have CPU/Memory limits to prevent noisy neighbors.
         Refined to preserve CommentedMap structure during injection.
         """
-        workload_kinds = ["Deployment", "StatefulSet", "Job", "DaemonSet", "ReplicaSet"]
-        
-        if doc.get("kind") not in workload_kinds:
+        if doc.get("kind") not in WORKLOAD_KINDS:
             return doc, ""
 
         modified = False
@@ -10,13 +10,41 @@ Author: Nishar A Sunkesala / KubeCuro Team
 Date: 2026-01-16
 """
 
-from typing import Dict, Any, Tuple, List
+from typing import Dict, Any, NamedTuple, Optional, Tuple, List
 import logging
 from ruamel.yaml.comments import CommentedMap
 
 # Standardized logging for audit trails
 logger = logging.getLogger("kubecuro.validator")
 
+class _CompiledSchema(NamedTuple):
+    """
+    A catalog schema level with its lookups resolved up front:
+    fields maps each key to (expected_type, child schema or None).
+    """
+    required: Tuple[str, ...]
+    fields: Dict[str, Tuple[Optional[str], Optional["_CompiledSchema"]]]
+
+def compile_schema(schema: Dict[str, Any]) -> _CompiledSchema:
+    """
+    Flattens one catalog schema (recursively) into a _CompiledSchema.
+    Only object fields and array items are descended into, mirroring
+    what the deep validation actually checks.
+    """
+    fields = {}
+    for key, field_info in schema.get("fields", {}).items():
+        if not field_info:
+            # Empty entries behave like unknown fields
+            continue
+        expected_type = field_info.get("type")
+        child = None
+        if expected_type == "object":
+            child = compile_schema(field_info)
+        elif expected_type == "array" and field_info.get("items"):
+            child = compile_schema(field_info["items"])
+        fields[key] = (expected_type, child)
+    return _CompiledSchema(tuple(schema.get("required", ())), fields)
+
 class KubeValidator:
     """
     Enforces schema integrity on healed manifests.
@@ -34,6 +62,8 @@ class KubeValidator:
         self.catalog = catalog
         # Core fields that must exist in every single K8s resource
         self.required_fields = ["apiVersion", "kind", "metadata"]
+        # kind -> compiled schema, built on first use and reused by every file
+        self._compiled: Dict[str, _CompiledSchema] = {}
 
     def validate_reconstruction(self, doc: Any, strict: bool = False) -> Tuple[bool, str]:
         """
@@ -55,37 +85,48 @@ class KubeValidator:
         if not schema:
             return True, f"Warning: Kind '{kind}' is outside local catalog. Basic validation only."
 
+        compiled = self._compiled.get(kind)
+        if compiled is None:
+            compiled = self._compiled[kind] = compile_schema(schema)
+
         # Perform recursive structural check, passing the strict flag
-        return self._deep_validate(doc, schema, strict=strict)
+        return self._deep_validate(doc, compiled, strict=strict)
+
+    def validate_batch(self, docs: List[Any], strict: bool = False) -> List[Tuple[bool, str]]:
+        """
+        Validates every document of a manifest in one call.
+        Returns one (valid, message) verdict per document, in order.
+        """
+        return [self.validate_reconstruction(doc, strict=strict) for doc in docs]
 
-    def _deep_validate(self, doc: Any, schema: Dict[str, Any], path: str = "", strict: bool = False) -> Tuple[bool, str]:
+    def _deep_validate(self, doc: Any, schema: _CompiledSchema, path: str = "", strict: bool = False) -> Tuple[bool, str]:
         """
         Recursively checks that the 'surgery' matches the K8s API expectations.
         Now properly handles the 'strict' flag for typo detection.
         """
         # Check required fields defined in the schema for this level
-        for req in schema.get("required", []):
+        for req in schema.required:
             if req not in doc:
                 return False, f"Structural Error: Field '{path + req}' is required but missing."
 
-        schema_fields = schema.get("fields", {})
+        schema_fields = schema.fields
         for key, value in doc.items():
             field_info = schema_fields.get(key)
             
             # Typo / Unknown Field Detection
-            if not field_info:
+            if field_info is None:
                 if strict:
                     return False, f"Strict Mode Violation: Unknown field '{path + key}'. Possible typo?"
                 continue 
 
-            expected_type = field_info.get("type")
+            expected_type, child = field_info
             
             # Type Validation: Object
             if expected_type == "object":
                 if not isinstance(value, (dict, CommentedMap)):
                     return False, f"Logic Error: '{path + key}' must be a map/object."
                 # PASSING STRICT DOWN RECURSIVELY
-                valid, err = self._deep_validate(value, field_info, path=f"{path}{key}.", strict=strict)
+                valid, err = self._deep_validate(value, child, path=f"{path}{key}.", strict=strict)
                 if not valid: return False, err
 
             # Type Validation: Array
@@ -94,7 +135,7 @@ class KubeValidator:
                     return False, f"Logic Error: '{path + key}' must be a list/sequence."
                 
                 # Check list items if schema provided
-                item_schema = field_info.get("items")
+                item_schema = child
                 if item_schema and value and isinstance(value[0], (dict, CommentedMap)):
                     # PASSING STRICT DOWN RECURSIVELY
                     valid, err = self._deep_validate(value[0], item_schema, path=f"{path}{key}[0].", strict=strict)
@@ -0,0 +1,51 @@
+import json
+import os
+from kubecuro.core import engine
+from kubecuro.core.engine import load_catalog
+
+def _write_catalog(path, entries):
+    catalog = {f"Kind{i}": {"apiVersion": "v1", "fields": ["metadata", "spec"]} for i in range(entries)}
+    path.write_text(json.dumps(catalog))
+    return catalog
+
+def test_small_catalog_skips_cache(tmp_path, monkeypatch):
+    """
+    CATALOG TEST: Small catalogs are parsed directly, no cache is written.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    source = tmp_path / "catalog.json"
+    catalog = _write_catalog(source, 3)
+    assert load_catalog(source) == catalog
+    assert not (tmp_path / "cache").exists()
+
+def test_large_catalog_round_trips_and_invalidates(tmp_path, monkeypatch):
+    """
+    CATALOG CACHE TEST: The pickle is reused, then rebuilt once the JSON changes.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    source = tmp_path / "catalog.json"
+    catalog = _write_catalog(source, 2000)
+    assert os.path.getsize(source) >= engine.CATALOG_CACHE_MIN_BYTES
+
+    assert load_catalog(source) == catalog
+    cached = list((tmp_path / "cache" / "kubecuro").glob("catalog-*.pkl"))
+    assert len(cached) == 1
+    assert load_catalog(source) == catalog
+
+    updated = _write_catalog(source, 2001)
+    os.utime(source, ns=(0, os.stat(source).st_mtime_ns + 10**9))
+    assert load_catalog(source) == updated
+
+def test_engines_share_one_parsed_catalog_until_it_changes(tmp_path, monkeypatch):
+    """
+    CATALOG MEMO TEST: Repeated loads reuse the parsed dict; an edit reloads it.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    source = tmp_path / "catalog.json"
+    _write_catalog(source, 3)
+    first = engine.shared_catalog(source)
+    assert engine.shared_catalog(source) is first
+
+    updated = _write_catalog(source, 4)
+    os.utime(source, ns=(0, os.stat(source).st_mtime_ns + 10**9))
+    assert engine.shared_catalog(source) == updated
@@ -0,0 +1,59 @@
+import pytest
+from kubecuro.core import filesystem
+from kubecuro.cli.main import run_processing_loop
+from kubecuro.cli.main_argparse_use_this_current_one_is_working import KubeCuroCLI
+
+BROKEN_POD = "apiVersion: v1\nkind:Pod\nmetadata:\n  name: web\n"
+
+@pytest.fixture
+def forbidden_home(tmp_path, monkeypatch):
+    """Treats tmp_path as the user's home directory."""
+    monkeypatch.setattr(filesystem, "FORBIDDEN_ROOTS", frozenset({str(tmp_path.resolve())}))
+    (tmp_path / "deploy.yaml").write_text(BROKEN_POD)
+    return tmp_path
+
+def _argparse_fix(path, **overrides):
+    args = KubeCuroCLI()._build_fix_parser().parse_args([str(path), "--yes-all"])
+    for name, value in overrides.items():
+        setattr(args, name, value)
+    return args
+
+def test_fixing_a_forbidden_root_directory_is_refused(forbidden_home):
+    """
+    SAFETY GATE TEST: Both CLIs refuse a bulk fix of / or $HOME before touching it.
+    """
+    with pytest.raises(SystemExit) as click_exit:
+        run_processing_loop(str(forbidden_home), dry_run=False, diff=False, max_depth=10,
+                            ext=".yaml", strict=False, yes_all=True)
+    with pytest.raises(SystemExit) as argparse_exit:
+        KubeCuroCLI()._run_engine(_argparse_fix(forbidden_home), is_fix_mode=True)
+    assert click_exit.value.code == argparse_exit.value.code == 1
+    assert (forbidden_home / "deploy.yaml").read_text() == BROKEN_POD
+
+@pytest.mark.parametrize("cli", ["click", "argparse"])
+def test_a_single_file_under_a_forbidden_root_can_be_fixed(forbidden_home, cli):
+    """
+    SAFETY GATE TEST: Naming one manifest in $HOME is not a bulk run.
+    """
+    target = forbidden_home / "deploy.yaml"
+    if cli == "click":
+        run_processing_loop(str(target), dry_run=False, diff=False, max_depth=10,
+                            ext=".yaml", strict=False, force=True, yes=True)
+    else:
+        KubeCuroCLI()._run_engine(_argparse_fix(target, force=True), is_fix_mode=True)
+    assert target.read_text() != BROKEN_POD
+    assert (forbidden_home / "deploy.kubecuro.backup").read_text() == BROKEN_POD
+
+@pytest.mark.parametrize("option, value", [("--jobs", "0"), ("--jobs", "-2"), ("--diff-context", "-1"),
+                                           ("--diff-limit", "-1")])
+def test_argparse_rejects_out_of_range_batch_options(option, value, capsys):
+    """
+    CLI PARITY TEST: The argparse CLI enforces the same ranges as click's IntRange.
+    """
+    cli = KubeCuroCLI()
+    for build in (cli._build_fix_parser, cli._build_scan_parser):
+        with pytest.raises(SystemExit) as rejected:
+            build().parse_args([".", option, value])
+        assert rejected.value.code == 2
+        assert "is not in the range" in capsys.readouterr().err
+    assert cli._build_scan_parser().parse_args([".", "--jobs", "1"]).jobs == 1
@@ -0,0 +1,338 @@
+import os
+import pytest
+from kubecuro.core import engine as engine_module
+from kubecuro.core.engine import AuditEngineV3
+from kubecuro.core.filesystem import find_catalog
+
+BROKEN_POD = "apiVersion: v1\nkind: Pod\nmetadata:\n  name: web\nspec:\n  containers:\n  - name: app\n    image: nginx\n"
+
+def test_identical_manifests_are_healed_once(tmp_path, monkeypatch):
+    """
+    HEAL MEMO TEST: Copies of one manifest reuse the first heal outcome.
+    """
+    for name in ("a.yaml", "b.yaml", "c.yaml"):
+        (tmp_path / name).write_text(BROKEN_POD)
+    engine = AuditEngineV3(str(tmp_path), find_catalog())
+
+    calls = []
+    real_run = engine.pipeline.run
+    monkeypatch.setattr(engine.pipeline, "run", lambda text: calls.append(text) or real_run(text))
+
+    reports = [engine.audit_and_heal_file(name) for name in ("a.yaml", "b.yaml", "c.yaml")]
+    assert len(calls) == 1
+    assert [r["file_path"] for r in reports] == ["a.yaml", "b.yaml", "c.yaml"]
+    assert len({(r["status"], r["kind"], r["healed_content"]) for r in reports}) == 1
+
+    # Validation settings are part of the key
+    engine.audit_and_heal_file("a.yaml", strict=True)
+    assert len(calls) == 2
+
+def test_git_safety_is_cached_until_gitignore_changes(tmp_path):
+    """
+    GIT SAFETY TEST: Warnings are computed once and refreshed on .gitignore edits.
+    """
+    (tmp_path / ".git").mkdir()
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("*.kubecuro.backup\n")
+    engine = AuditEngineV3(str(tmp_path), find_catalog())
+
+    assert engine.check_git_safety() == ["Add '*.kubecuro.tmp' to .gitignore"]
+    cached = engine._git_warnings_cache
+    assert engine.check_git_safety() == ["Add '*.kubecuro.tmp' to .gitignore"]
+    assert engine._git_warnings_cache is cached
+
+    gitignore.write_text("*.kubecuro.backup\n*.kubecuro.tmp\n")
+    assert engine.check_git_safety() == []
+
+def test_backup_names_continue_after_existing_snapshots(tmp_path):
+    """
+    BACKUP TEST: New backups never reuse a name, including across stems like app-1.
+    """
+    for name in ("app.kubecuro.backup", "app-1.kubecuro.backup", "app-7.kubecuro.backup"):
+        (tmp_path / name).write_text("old")
+    engine = AuditEngineV3(str(tmp_path), find_catalog())
+
+    first = engine._create_unique_backup(tmp_path / "app.yaml")
+    second = engine._create_unique_backup(tmp_path / "app.yaml")
+    assert (first.name, second.name) == ("app-8.kubecuro.backup", "app-9.kubecuro.backup")
+    assert first.exists() and (tmp_path / "app-7.kubecuro.backup").read_text() == "old"
+
+    # app-1.kubecuro.backup already exists, so the unnumbered name is skipped
+    assert engine._create_unique_backup(tmp_path / "app-1.yaml").name == "app-1-1.kubecuro.backup"
+    assert engine._create_unique_backup(tmp_path / "web.yaml").name == "web.kubecuro.backup"
+
+def test_atomic_write_keeps_mode_and_leaves_no_temp_files(tmp_path):
+    """
+    ATOMIC WRITE TEST: Content is replaced in place with the original permissions.
+    """
+    target = tmp_path / "deploy.yaml"
+    target.write_text("old: 1\n")
+    target.chmod(0o640)
+    engine = AuditEngineV3(str(tmp_path), find_catalog())
+
+    engine._atomic_write(target, "new: 2\n")
+    assert target.read_text() == "new: 2\n"
+    assert (target.stat().st_mode & 0o777) == 0o640
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["deploy.yaml"]
+
+def test_engines_accept_a_preloaded_catalog(tmp_path):
+    """
+    CATALOG SHARING TEST: A parsed catalog is used as-is, without touching the path.
+    """
+    catalog = {"Pod": {"apiVersion": "v1", "fields": {}}}
+    first = AuditEngineV3(str(tmp_path), "does/not/exist.json", catalog=catalog)
+    second = AuditEngineV3(str(tmp_path), "does/not/exist.json", catalog=catalog)
+    assert first.catalog is second.catalog is catalog
+
+def test_cleanup_removes_only_expired_backups(tmp_path):
+    """
+    CLEANUP TEST: Old backups anywhere in the tree go; fresh ones and manifests stay.
+    """
+    old = tmp_path / "deep" / "er" / "app.kubecuro.backup"
+    old.parent.mkdir(parents=True)
+    old.write_text("old")
+    os.utime(old, (0, 0))
+    fresh = tmp_path / "app-1.kubecuro.backup"
+    fresh.write_text("fresh")
+    (tmp_path / "app.yaml").write_text("kind: Pod\n")
+    # Directories the manifest walk prunes still get their backups cleaned
+    vendored = tmp_path / ".venv" / "chart.kubecuro.backup"
+    vendored.parent.mkdir()
+    vendored.write_text("old")
+    os.utime(vendored, (0, 0))
+    engine = AuditEngineV3(str(tmp_path), "", catalog={})
+
+    assert engine.cleanup_backups(max_age_hours=1) == 2
+    assert not old.exists() and not vendored.exists()
+    assert fresh.exists() and (tmp_path / "app.yaml").exists()
+
+def test_parallel_scan_matches_serial_scan(tmp_path):
+    """
+    PARALLEL SCAN TEST: Pooled workers return the serial reports, in discovery order.
+    """
+    for i in range(5):
+        (tmp_path / f"pod{i}.yaml").write_text(BROKEN_POD if i % 2 else "kind: [\n")
+    engine = AuditEngineV3(str(tmp_path), find_catalog())
+
+    progress = []
+    pooled = engine.scan_directory(jobs=2, progress_callback=lambda done, total: progress.append(done))
+    serial = engine.scan_directory(jobs=1)
+
+    assert [(r["file_path"], r["status"]) for r in pooled] == [(r["file_path"], r["status"]) for r in serial]
+    assert progress == [1, 2, 3, 4, 5]
+
+def test_scan_stays_serial_unless_jobs_are_requested(tmp_path, monkeypatch):
+    """
+    PARALLEL SCAN TEST: A plain scan_directory call never starts a process pool.
+    """
+    for i in range(engine_module.POOL_MIN_FILES):
+        (tmp_path / f"pod{i}.yaml").write_text(BROKEN_POD)
+    engine = AuditEngineV3(str(tmp_path), find_catalog())
+    pools = []
+    monkeypatch.setattr(engine_module.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(engine_module, "audit_in_pool", lambda *a, **kw: pools.append(a) or [])
+
+    assert len(engine.scan_directory()) == engine_module.POOL_MIN_FILES
+    assert pools == []
+    assert engine.scan_directory(jobs=2) == [] and len(pools) == 1
+
+def test_pool_collector_keeps_order_and_reports_progress(tmp_path):
+    """
+    PARALLEL SCAN TEST: The shared CLI/engine collector returns slim rows in input order.
+    """
+    names = [f"pod{i}.yaml" for i in range(5)]
+    for name in names:
+        (tmp_path / name).write_text(BROKEN_POD)
+    done = []
+    engine = AuditEngineV3(str(tmp_path), find_catalog())
+    rows = engine_module.audit_in_pool(engine, list(reversed(names)), 2, slim=True,
+                                       on_done=lambda count, rel_path: done.append((count, rel_path)))
+    assert [r.file_path for r in rows] == list(reversed(names))
+    assert [count for count, _ in done] == [1, 2, 3, 4, 5]
+    assert sorted(rel_path for _, rel_path in done) == names
+
+def test_serial_scan_audits_files_as_they_are_discovered(tmp_path, monkeypatch):
+    """
+    STREAMING SCAN TEST: Past the pool-decision lookahead, files are audited as found.
+    """
+    for i in range(6):
+        (tmp_path / f"pod{i}.yaml").write_text(BROKEN_POD)
+    engine = AuditEngineV3(str(tmp_path), find_catalog())
+    events = []
+    real_iter = engine_module.iter_yaml_files
+    real_audit = engine.audit_and_heal_file
+
+    def spy_iter(*args, **kwargs):
+        for path in real_iter(*args, **kwargs):
+            events.append("found")
+            yield path
+
+    def spy_audit(rel_path, **kwargs):
+        events.append("audited")
+        return real_audit(rel_path, **kwargs)
+
+    monkeypatch.setattr(engine_module, "iter_yaml_files", spy_iter)
+    monkeypatch.setattr(engine, "audit_and_heal_file", spy_audit)
+    assert len(engine.scan_directory(jobs=1)) == 6
+    assert events == ["found", "audited"] * 6
+
+def test_fix_mode_serial_scan_audits_each_file_exactly_once(tmp_path, monkeypatch):
+    """
+    STREAMING SCAN TEST: Backups, temp files and renames written mid-walk never
+    make the walker repeat or miss a manifest.
+    """
+    expected = []
+    for folder in ("", "nested"):
+        (tmp_path / folder).mkdir(exist_ok=True)
+        for i in range(60):
+            (tmp_path / folder / f"pod{i}.yaml").write_text(f"apiVersion: v1\nkind:Pod\nmetadata:\n  name: p{i}\n")
+            expected.append(os.path.join(folder, f"pod{i}.yaml"))
+    engine = AuditEngineV3(str(tmp_path), find_catalog())
+    audited = []
+    real_audit = engine.audit_and_heal_file
+    monkeypatch.setattr(engine, "audit_and_heal_file",
+                        lambda rel_path, **kwargs: audited.append(rel_path) or real_audit(rel_path, **kwargs))
+
+    # readdir behaviour after a change is unspecified, so also check directly
+    # that no write lands in a directory whose listing is still open
+    open_listings, writes_mid_listing = [], []
+    real_scandir, real_write = os.scandir, engine._atomic_write
+
+    class TrackedListing:
+        def __init__(self, path):
+            self.path, self.it = os.path.realpath(path), real_scandir(path)
+        def __enter__(self):
+            open_listings.append(self.path)
+            return self.it
+        def __exit__(self, *exc):
+            open_listings.remove(self.path)
+            return self.it.__exit__(*exc)
+
+    def checked_write(target, content):
+        # Recorded rather than asserted: the scan loop logs and skips exceptions
+        if os.path.dirname(str(target)) in open_listings:
+            writes_mid_listing.append(str(target))
+        return real_write(target, content)
+
+    monkeypatch.setattr(os, "scandir", TrackedListing)
+    monkeypatch.setattr(engine, "_atomic_write", checked_write)
+    reports = engine.scan_directory(dry_run=False, force_write=True, jobs=1)
+    assert writes_mid_listing == []
+    assert sorted(audited) == sorted(expected)
+    assert all(r["written"] for r in reports)
+    assert len(list(tmp_path.glob("**/*.kubecuro.backup"))) == 120
+
+def test_backup_is_a_hard_link_to_the_original_inode(tmp_path):
+    """
+    BACKUP TEST: The snapshot keeps the pre-heal inode; the healed file gets a new one.
+    """
+    target = tmp_path / "app.yaml"
+    target.write_text("apiVersion: v1\nkind:Pod\nmetadata:\n  name: web\n")
+    original_inode = target.stat().st_ino
+    engine = AuditEngineV3(str(tmp_path), find_catalog())
+
+    report = engine.audit_and_heal_file("app.yaml", dry_run=False, force_write=True)
+    assert report["written"] and report["backup_created"] == "app.kubecuro.backup"
+    backup = tmp_path / "app.kubecuro.backup"
+    assert backup.stat().st_ino == original_inode != target.stat().st_ino
+    assert backup.read_text() == "apiVersion: v1\nkind:Pod\nmetadata:\n  name: web\n"
+
+def test_failed_write_leaves_no_backup_behind(tmp_path, monkeypatch):
+    """
+    BACKUP TEST: When the healed text cannot be written, the linked snapshot is removed.
+    """
+    target = tmp_path / "app.yaml"
+    target.write_text("apiVersion: v1\nkind:Pod\nmetadata:\n  name: web\n")
+    engine = AuditEngineV3(str(tmp_path), find_catalog())
+
+    def fail_write(path, content):
+        raise IOError("disk full")
+
+    monkeypatch.setattr(engine, "_atomic_write", fail_write)
+    report = engine.audit_and_heal_file("app.yaml", dry_run=False, force_write=True)
+    assert (report["written"], report["success"], report["backup_created"]) == (False, False, None)
+    assert report["write_error"] == "disk full"
+    assert list(tmp_path.glob("*.kubecuro.backup")) == []
+    assert target.read_text() == "apiVersion: v1\nkind:Pod\nmetadata:\n  name: web\n"
+
+def test_non_kubernetes_yaml_skips_the_pipeline(tmp_path, monkeypatch):
+    """
+    PRE-FILTER TEST: YAML without apiVersion or kind is reported, never healed.
+    """
+    (tmp_path / "values.yaml").write_text("replicaCount:2\nimage:\n  repository: nginx\n")
+    (tmp_path / "ci.yaml").write_text("# any kind of runner\nrunner: linux\n")
+    (tmp_path / "team.yaml").write_text("kindness: 1\n")
+    engine = AuditEngineV3(str(tmp_path), find_catalog())
+    monkeypatch.setattr(engine, "_heal_text", lambda *a: pytest.fail("pipeline ran"))
+
+    report = engine.audit_and_heal_file("values.yaml", dry_run=False)
+    assert (report["status"], report["success"], report["written"]) == ("NOT_K8S", True, False)
+    assert report["validation_error"] == "" and report["logic_logs"]
+    assert (tmp_path / "values.yaml").read_text() == "replicaCount:2\nimage:\n  repository: nginx\n"
+    assert [engine.audit_and_heal_file(name)["status"] for name in ("ci.yaml", "team.yaml")] == ["NOT_K8S"] * 2
+
+def test_already_healed_files_skip_the_pipeline_on_the_next_run(tmp_path, monkeypatch):
+    """
+    HEAL STAMP TEST: A text found unchanged is not re-healed by a later engine.
+    """
+    for i in range(5):
+        (tmp_path / f"cm{i}.yaml").write_text(f"apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: cm{i}\n  namespace: default\n")
+    scanner = AuditEngineV3(str(tmp_path), find_catalog())
+    first = scanner.scan_directory(jobs=2)
+    assert {r["status"] for r in first} == {"UNCHANGED"}
+    scanner.save_heal_stamps()
+
+    engine = AuditEngineV3(str(tmp_path), find_catalog())
+    monkeypatch.setattr(engine, "_heal_text", lambda *a: pytest.fail("pipeline ran"))
+    second = engine.scan_directory(jobs=1)
+    assert [(r["file_path"], r["status"], r["kind"]) for r in second] == \
+        [(r["file_path"], r["status"], r["kind"]) for r in first]
+
+    # A different strictness is a different outcome and is not served from the stamps
+    with pytest.raises(pytest.fail.Exception):
+        engine.audit_and_heal_file("cm0.yaml", strict=True)
+
+def test_heal_stamps_from_every_engine_and_worker_survive(tmp_path):
+    """
+    HEAL STAMP TEST: Disjoint saves merge, pooled workers' stamps reach the store,
+    and other configurations keep their own stamps.
+    """
+    for i in range(6):
+        (tmp_path / f"cm{i}.yaml").write_text(f"apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: cm{i}\n  namespace: default\n")
+    first, second = AuditEngineV3(str(tmp_path), find_catalog()), AuditEngineV3(str(tmp_path), find_catalog())
+    first.audit_and_heal_file("cm0.yaml")
+    second.audit_and_heal_file("cm1.yaml")
+    first.save_heal_stamps()
+    second.save_heal_stamps()
+    assert len(AuditEngineV3(str(tmp_path), find_catalog())._read_heal_stamps()) == 2
+
+    pooled = AuditEngineV3(str(tmp_path), find_catalog())
+    pooled.scan_directory(jobs=3)
+    # Scanning alone never writes the store
+    assert len(pooled._read_heal_stamps()) == 2
+    pooled.save_heal_stamps()
+    assert len(pooled._read_heal_stamps()) == 6
+
+    bigger = AuditEngineV3(str(tmp_path), find_catalog(), cpu="2")
+    bigger.audit_and_heal_file("cm0.yaml")
+    bigger.save_heal_stamps()
+    assert len(bigger._read_heal_stamps()) == 1
+    assert len(AuditEngineV3(str(tmp_path), find_catalog())._read_heal_stamps()) == 6
+
+def test_batch_mode_syncs_each_directory_once(tmp_path, monkeypatch):
+    """
+    BATCH WRITE TEST: Deferred renames are made durable with one fsync per directory.
+    """
+    engine = AuditEngineV3(str(tmp_path), "", catalog={})
+    synced = []
+    monkeypatch.setattr(engine, "_fsync_directory", synced.append)
+
+    engine.defer_directory_syncs()
+    for name in ("a.yaml", "b.yaml", "c.yaml"):
+        (tmp_path / name).write_text("old")
+        engine._atomic_write(tmp_path / name, "new")
+    assert synced == [] and (tmp_path / "b.yaml").read_text() == "new"
+
+    engine.sync_directories()
+    engine._atomic_write(tmp_path / "a.yaml", "newer")
+    assert synced == [str(tmp_path), str(tmp_path)]
@@ -0,0 +1,11 @@
+from ruamel.yaml import YAML
+from kubecuro.healing.exporter import KubeExporter
+
+def test_preferred_keys_lead_and_unknown_keys_keep_their_order():
+    """
+    EXPORT ORDER TEST: apiVersion/kind/metadata/spec come first; the rest stay put.
+    """
+    doc = YAML(typ='rt').load("zeta: 1\nspec: {}\nalpha: 2\nkind: Pod  # eol\napiVersion: v1\n")
+    ordered = KubeExporter()._get_sorted_map(doc)
+    assert list(ordered) == ["apiVersion", "kind", "spec", "zeta", "alpha"]
+    assert "kind" in ordered.ca.items
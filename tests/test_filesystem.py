@@ -0,0 +1,171 @@
+import os
+import pytest
+from kubecuro.core.filesystem import (
+    ManifestTooLarge, find_catalog, is_forbidden_root, iter_matching_entries, iter_yaml_files, read_yaml_text,
+)
+
+def _touch(path, text="kind: Pod\n"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+def test_discovery_filters_extensions_and_depth(tmp_path):
+    """
+    DISCOVERY TEST: Only matching extensions within max_depth are yielded.
+    """
+    _touch(tmp_path / "a.yaml")
+    _touch(tmp_path / "b.yml")
+    _touch(tmp_path / "notes.txt")
+    _touch(tmp_path / "one" / "c.yaml")
+    _touch(tmp_path / "one" / "two" / "d.yaml")
+
+    found = sorted(os.path.relpath(p, tmp_path) for p in iter_yaml_files(str(tmp_path), (".yaml", ".yml"), 2))
+    assert found == ["a.yaml", "b.yml", os.path.join("one", "c.yaml")]
+
+def test_directories_beyond_max_depth_are_never_opened(tmp_path, monkeypatch):
+    """
+    DEPTH PRUNING TEST: The walker stops descending instead of post-filtering.
+    """
+    _touch(tmp_path / "one" / "two" / "three" / "deep.yaml")
+    opened = []
+    real_scandir = os.scandir
+
+    def spy(path):
+        opened.append(os.path.relpath(path, tmp_path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", spy)
+    assert list(iter_yaml_files(str(tmp_path), (".yaml",), 2)) == []
+    assert sorted(opened) == [".", "one"]
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX symlink semantics")
+def test_discovery_never_follows_symlinks(tmp_path):
+    """
+    LOOP SAFETY TEST: Symlinked files and directories are ignored.
+    """
+    _touch(tmp_path / "real.yaml")
+    os.symlink(tmp_path / "real.yaml", tmp_path / "link.yaml")
+    os.symlink(tmp_path, tmp_path / "trap", target_is_directory=True)
+
+    found = [os.path.basename(p) for p in iter_yaml_files(str(tmp_path), (".yaml",), 10)]
+    assert found == ["real.yaml"]
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX symlink semantics")
+def test_followed_symlinks_stay_inside_root_and_never_cycle(tmp_path):
+    """
+    LOOP SAFETY TEST: Opt-in following walks in-tree links once and skips escapes.
+    """
+    root = tmp_path / "ws"
+    _touch(root / "real.yaml")
+    _touch(tmp_path / "outside.yaml")
+    os.symlink(root / "real.yaml", root / "link.yaml")
+    os.symlink(tmp_path / "outside.yaml", root / "escape.yaml")
+    os.symlink(root, root / "trap", target_is_directory=True)
+
+    skipped = []
+    found = sorted(os.path.relpath(p, root) for p in
+                   iter_yaml_files(str(root), (".yaml",), 10, skipped=skipped, follow_symlinks=True))
+    assert found == ["link.yaml", "real.yaml"]
+    assert skipped == [str(root / "escape.yaml")]
+
+def test_discovery_records_unreadable_directories(tmp_path):
+    """
+    PERMISSION TEST: Directories that cannot be opened are reported, not raised.
+    """
+    missing = str(tmp_path / "gone")
+    unreadable = []
+    assert list(iter_yaml_files(missing, (".yaml",), 5, unreadable=unreadable)) == []
+    assert unreadable == [missing]
+
+def test_read_strips_utf8_bom(tmp_path):
+    """
+    INGESTION TEST: A leading BOM is dropped exactly like utf-8-sig.
+    """
+    target = tmp_path / "bom.yaml"
+    target.write_bytes(b"\xef\xbb\xbfkind: Pod\n")
+    assert read_yaml_text(str(target)) == "kind: Pod\n"
+    assert read_yaml_text(str(target)) == target.read_text(encoding="utf-8-sig")
+
+def test_forbidden_roots_cover_root_and_home(tmp_path):
+    """
+    SAFETY GATE TEST: / and $HOME are refused, project directories are not.
+    """
+    assert is_forbidden_root(os.path.realpath(os.sep))
+    assert is_forbidden_root(os.path.realpath(os.path.expanduser("~")))
+    assert not is_forbidden_root(str(tmp_path))
+
+def test_read_handles_empty_and_large_files(tmp_path):
+    """
+    INGESTION TEST: Empty files and multi-chunk files read back intact.
+    """
+    empty = tmp_path / "empty.yaml"
+    empty.write_bytes(b"")
+    assert read_yaml_text(empty) == ""
+
+    body = "data: " + "x" * 200000 + "\n"
+    large = tmp_path / "large.yaml"
+    large.write_text(body, encoding="utf-8")
+    assert read_yaml_text(large) == body
+
+def test_catalog_search_is_shared_and_cached():
+    """
+    CATALOG DISCOVERY TEST: The catalog is found once and the answer reused.
+    """
+    find_catalog.cache_clear()
+    found = find_catalog()
+    assert os.path.isfile(found)
+    assert find_catalog() is found
+    assert find_catalog.cache_info().hits == 1
+
+def test_read_refuses_oversized_manifests(tmp_path):
+    """
+    INGESTION TEST: Files above the size cap are rejected before being read.
+    """
+    target = tmp_path / "huge.yaml"
+    target.write_bytes(b"x" * 2048)
+    assert len(read_yaml_text(target, max_bytes=2048)) == 2048
+    with pytest.raises(ManifestTooLarge):
+        read_yaml_text(target, max_bytes=2047)
+
+def test_noise_directories_are_pruned(tmp_path, monkeypatch):
+    """
+    DEPTH PRUNING TEST: .git, node_modules and friends are never opened.
+    """
+    _touch(tmp_path / "app.yaml")
+    for noise in (".git", "node_modules", ".venv", "__pycache__"):
+        _touch(tmp_path / noise / "chart.yaml")
+    opened = []
+    real_scandir = os.scandir
+
+    def spy(path):
+        opened.append(os.path.relpath(path, tmp_path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", spy)
+    assert [os.path.basename(p) for p in iter_yaml_files(str(tmp_path), (".yaml",), 5)] == ["app.yaml"]
+    assert opened == ["."]
+    assert len(list(iter_yaml_files(str(tmp_path), (".yaml",), 5, skip_dirs=frozenset()))) == 5
+
+def test_large_manifests_are_decoded_from_a_mapping(tmp_path, monkeypatch):
+    """
+    INGESTION TEST: The mmap path strips the BOM and decodes like the read path.
+    """
+    import kubecuro.core.filesystem as filesystem
+    body = "data: " + "é" * 4000 + "\n"
+    target = tmp_path / "mapped.yaml"
+    target.write_bytes(b"\xef\xbb\xbf" + body.encode("utf-8"))
+
+    monkeypatch.setattr(filesystem, "MMAP_MIN_BYTES", 1024)
+    assert read_yaml_text(target) == body
+    target.write_bytes(b"kind: \xff\n" * 200)
+    with pytest.raises(UnicodeDecodeError):
+        read_yaml_text(target)
+
+def test_matching_entries_carry_their_stat(tmp_path):
+    """
+    DISCOVERY TEST: The entry walker yields DirEntry objects for the same files.
+    """
+    _touch(tmp_path / "a.kubecuro.backup", "12345")
+    _touch(tmp_path / "node_modules" / "b.kubecuro.backup")
+    entries = list(iter_matching_entries(str(tmp_path), (".kubecuro.backup",), 5, skip_dirs=frozenset()))
+    assert sorted(e.name for e in entries) == ["a.kubecuro.backup", "b.kubecuro.backup"]
+    assert {e.name: e.stat().st_size for e in entries}["a.kubecuro.backup"] == 5
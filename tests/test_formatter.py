@@ -0,0 +1,38 @@
+from kubecuro.cli.formatter import (
+    DIFF_COLLAPSE_LINES, TABLE_PREVIEW_ROWS, TABLE_ROW_LIMIT,
+    report_column_widths, side_by_side_table, table_rows,
+)
+from kubecuro.core.models import AuditReport
+
+def test_short_manifest_diff_is_shown_whole():
+    """
+    DIFF TEST: Short manifests render as a single ORIGINAL | HEALED row.
+    """
+    table = side_by_side_table("pod.yaml", "kind: Pod\n", "kind: Pod\nspec: {}\n")
+    assert table.row_count == 1
+
+def test_long_manifest_diff_collapses_to_hunks():
+    """
+    DIFF TEST: Long manifests render one row per changed hunk only.
+    """
+    old = "\n".join(f"key{i}: {i}" for i in range(DIFF_COLLAPSE_LINES + 100))
+    new = old.replace("key10: 10", "key10: ten").replace("key400: 400", "key400: four")
+    assert side_by_side_table("big.yaml", old, new, context=2).row_count == 2
+
+def test_large_batches_preview_until_full_table():
+    """
+    TABLE TEST: Oversized batches draw a preview unless the full table is asked for.
+    """
+    reports = [AuditReport(file_path=f"m{i}.yaml", status="HEALTHY") for i in range(TABLE_ROW_LIMIT + 1)]
+    assert len(table_rows(reports)) == TABLE_PREVIEW_ROWS
+    assert len(table_rows(reports, full=True)) == len(reports)
+    assert len(table_rows(reports[:TABLE_ROW_LIMIT])) == TABLE_ROW_LIMIT
+
+def test_column_widths_fit_console():
+    """
+    TABLE TEST: Long paths are capped so Kind/Status keep their natural width.
+    """
+    rows = [AuditReport(file_path="x" * 200, status="PREVIEW", kind="Deployment")]
+    path_w, kind_w, status_w = report_column_widths(rows, ("Path", "Kind", "Status"), 80)
+    assert (kind_w, status_w) == (len("Deployment"), len("PREVIEW"))
+    assert path_w < 80 - kind_w - status_w
@@ -0,0 +1,107 @@
+import random
+from kubecuro.healing.lexer import KubeLexer
+from kubecuro.healing.shadow import KubeShadow
+
+def _reference_split(text):
+    """The original per-character state machine."""
+    in_double_quote = in_single_quote = escaped = False
+    for i, char in enumerate(text):
+        if escaped: escaped = False; continue
+        if char == '\\': escaped = True; continue
+        if char == '"' and not in_single_quote: in_double_quote = not in_double_quote
+        elif char == "'" and not in_double_quote: in_single_quote = not in_single_quote
+        if char == '#' and not in_double_quote and not in_single_quote:
+            if i == 0 or text[i-1].isspace(): return i
+    return -1
+
+def test_comment_split_respects_quotes_and_escapes():
+    """
+    LEXER TEST: '#' only starts a comment outside quotes and after whitespace.
+    """
+    lexer = KubeLexer()
+    assert lexer._find_comment_split("image: nginx # pinned") == 13
+    assert lexer._find_comment_split("# header") == 0
+    assert lexer._find_comment_split('cmd: "echo # not a comment"') == -1
+    assert lexer._find_comment_split("url: http://host/#anchor") == -1
+    assert lexer._find_comment_split('msg: "a \\" # b" # c') == 16
+
+def test_comment_split_matches_reference_state_machine():
+    """
+    LEXER FUZZ TEST: The token-skipping scan agrees with the per-character loop,
+    for the lexer and for the shadow that shares it.
+    """
+    lexer, shadow = KubeLexer(), KubeShadow()
+    rng = random.Random(1234)
+    alphabet = ['a', ' ', '\t', '#', '"', "'", '\\', ':', '-']
+    for _ in range(5000):
+        line = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+        assert lexer._find_comment_split(line) == _reference_split(line), line
+        assert shadow._find_safe_comment_idx(line) == _reference_split(line), line
+    # Quote-free lines take the str.find path
+    for _ in range(2000):
+        line = "".join(rng.choice(['a', ' ', '\t', '#', ':']) for _ in range(rng.randint(0, 24)))
+        assert lexer._find_comment_split(line) == _reference_split(line), line
+
+def test_stuck_colon_scan_matches_the_regex():
+    """
+    LEXER FUZZ TEST: The str.find colon fixer agrees with the original re.sub.
+    """
+    import re
+    from kubecuro.healing.lexer import _space_stuck_colons
+    pattern = re.compile(r'(?<!http)(?<!https):(?!\s)([a-zA-Z])')
+    assert _space_stuck_colons("kind:Pod") == "kind: Pod"
+    assert _space_stuck_colons("url: https://x:y") == "url: https://x: y"
+    rng = random.Random(99)
+    alphabet = ['h', 't', 'p', 's', ':', ' ', 'a', '1', '/', 'é']
+    for _ in range(5000):
+        line = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+        assert _space_stuck_colons(line) == pattern.sub(r': \1', line), line
+
+def test_shard_drops_bom_and_crlf():
+    """
+    LEXER TEST: A BOM and CRLF line endings never reach the shards.
+    """
+    shards = KubeLexer().shard("\ufeffkind: Pod\r\nmetadata:\r\n- name: web\r\n")
+    assert [s.raw_line for s in shards] == ["kind: Pod", "metadata:", "- name: web"]
+    assert (shards[0].key, shards[0].value) == ("kind", "Pod")
+    assert (shards[2].indent, shards[2].is_list_item) == (2, True)
+
+def test_reused_pipeline_stages_do_not_leak_between_files():
+    """
+    PIPELINE REUSE TEST: Block state and captured comments reset for each file.
+    """
+    from kubecuro.healing.pipeline import HealingPipeline
+    pipeline = HealingPipeline({})
+    lexer, shadow = pipeline.lexer, pipeline.shadow
+
+    pipeline.run("kind: ConfigMap  # first\ndata:\n  conf: |\n    line\n")
+    assert shadow.comment_map and lexer.in_block
+    context = pipeline.run("kind: Pod\nmetadata:\n  name: web\n")
+    assert pipeline.lexer is lexer and pipeline.shadow is shadow
+    assert shadow.comment_map == {} and not lexer.in_block and context.kind == "Pod"
+
+def test_extract_semantics_splits_keys_values_and_dashes():
+    """
+    LEXER TEST: Keys, values and list dashes come out of one partition.
+    """
+    lexer = KubeLexer()
+    assert lexer._extract_semantics("- image: nginx") == ("image", "nginx", True)
+    assert lexer._extract_semantics("  spec:  ") == ("spec", None, False)
+    assert lexer._extract_semantics("url: http://x:80") == ("url", "http://x:80", False)
+    assert lexer._extract_semantics("- plain") == ("", "plain", True)
+    assert lexer._extract_semantics("-") == ("", "", True)
+    assert lexer._extract_semantics("   ") == ("", None, False)
+
+def test_repeated_lines_are_repaired_from_the_cache():
+    """
+    LEXER MEMO TEST: Cached repairs still carry block state in and out.
+    """
+    from kubecuro.healing.lexer import _repair_line_cached
+    _repair_line_cached.cache_clear()
+    lexer = KubeLexer()
+    text = "data:\n  a: |\n    kind:Pod\n  b: |\n    kind:Pod\nports:\n  - name:web\n  - name:web\n"
+    shards = lexer.shard(text)
+    assert [s.value for s in shards] == [None, "|", "Pod", "|", "Pod", None, "web", "web"]
+    assert _repair_line_cached.cache_info().hits == 2
+    assert lexer.repair_line("-name:web  # x") == (0, "- name: web  ", "x")
+    assert not lexer.in_block
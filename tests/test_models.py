@@ -0,0 +1,71 @@
+import sys
+import pytest
+from dataclasses import fields
+from kubecuro.core.models import AuditReport, Shard
+
+def test_report_row_from_engine_result():
+    """
+    REPORT ROW TEST: Only row fields are kept and a missing kind defaults.
+    """
+    row = AuditReport.from_result({
+        "file_path": "app/deploy.yaml", "status": "HEALED", "success": True,
+        "kind": None, "healed_content": "kind: Deployment\n", "logic_logs": ["x"],
+        "backup_created": "app/deploy.kubecuro.backup",
+    })
+    assert row.file_path == "app/deploy.yaml"
+    assert row.kind == "Unknown"
+    assert row.success and not row.partial_heal
+    assert row.backup_created == "app/deploy.kubecuro.backup"
+    assert row.git_warnings == []
+    assert not hasattr(row, "healed_content")
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+def test_report_row_has_no_instance_dict():
+    """
+    FOOTPRINT TEST: Rows are slotted, so no per-instance __dict__ is kept.
+    """
+    row = AuditReport(file_path="a.yaml", status="PREVIEW")
+    assert not hasattr(row, "__dict__")
+    assert not hasattr(Shard(line_no=1, indent=0, key="kind"), "__dict__")
+
+def test_failed_audit_becomes_engine_error_row():
+    """
+    BATCH SAFETY TEST: A raising audit yields an ENGINE_ERROR report with its type.
+    """
+    from kubecuro.core.engine import safe_audit, slim_report
+
+    class BrokenEngine:
+        def audit_and_heal_file(self, relative_path, **kwargs):
+            raise ValueError("bad indent")
+
+    report = safe_audit(BrokenEngine(), "apps/web/deploy.yaml", dry_run=True)
+    assert report["status"] == "ENGINE_ERROR"
+    assert report["error"] == "ValueError: bad indent"
+    row = slim_report(report)
+    assert row.file_path == "deploy.yaml" and not row.success
+
+def test_summary_counts_rows_and_dicts_alike(tmp_path):
+    """
+    SUMMARY TEST: AuditReport rows and raw result dicts are tallied identically.
+    """
+    from kubecuro.core.engine import AuditEngineV3
+
+    results = [
+        {"file_path": "a.yaml", "status": "HEALED", "success": True, "written": True, "backup_created": "a.kubecuro.backup"},
+        {"file_path": "b.yaml", "status": "UNCHANGED", "success": True},
+        {"file_path": "c.yaml", "status": "ENGINE_ERROR", "success": False},
+    ]
+    rows = [AuditReport.from_result(r) for r in results]
+    engine = AuditEngineV3(str(tmp_path), "", catalog={})
+    for batch in (results, rows):
+        summary = engine.generate_summary(batch)
+        assert (summary["total_files"], summary["successful"], summary["written_to_disk"],
+                summary["backups_created"], summary["system_errors"]) == (3, 2, 1, 1, 1)
+
+def test_shard_signature():
+    """
+    MODEL TEST: Shard keeps the field set the lexer and scanner construct it with.
+    """
+    assert [f.name for f in fields(Shard)] == [
+        "line_no", "indent", "key", "value", "is_list_item", "comment", "raw_line",
+    ]
@@ -0,0 +1,58 @@
+import random
+from kubecuro.healing.scanner import KubeScanner
+
+def _reference_scan(raw_text):
+    """The original per-line loop, as (line_no, indent, key, value, is_list, raw_line)."""
+    found = []
+    for i, line in enumerate(raw_text.splitlines(), 1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        match = KubeScanner.LINE_PATTERN.match(line)
+        if match:
+            indent_str, dash, key, value = match.groups()
+            found.append((i, len(indent_str), key, value.strip() if value else None, dash is not None, line))
+        else:
+            content = line.lstrip()
+            is_list = content.startswith('-')
+            found.append((i, len(line) - len(content), "",
+                          content[1:].lstrip() if is_list else content, is_list, line))
+    return found
+
+def _as_tuples(shards):
+    return [(s.line_no, s.indent, s.key, s.value, s.is_list_item, s.raw_line) for s in shards]
+
+def test_scan_finds_identity_and_keeps_line_numbers():
+    """
+    SCANNER TEST: Matches, list scalars and skipped lines keep their numbering.
+    """
+    scanner = KubeScanner()
+    text = "# header\napiVersion: v1\n\nkind: 'Pod'\nspec:\n  args:\n  - --verbose\n  - name: web\n"
+    shards = scanner.scan(text)
+    assert scanner.get_identity() == ("Pod", "v1")
+    assert [(s.line_no, s.key, s.value) for s in shards] == [
+        (2, "apiVersion", "v1"), (4, "kind", "'Pod'"), (5, "spec", None),
+        (6, "args", None), (7, "", "--verbose"), (8, "name", "web")]
+
+def test_scan_matches_the_original_loop():
+    """
+    SCANNER FUZZ TEST: Matching before the blank/comment check changes no output.
+    """
+    scanner = KubeScanner()
+    rng = random.Random(4321)
+    pieces = ["key", ":", " ", "  ", "-", "#", "val", "\n", "\n", "\t", "a.b/c"]
+    for _ in range(3000):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 30)))
+        assert _as_tuples(scanner.scan(text)) == _reference_scan(text), repr(text)
+
+def test_pipeline_splits_the_repaired_text_once():
+    """
+    PIPELINE TEST: Shadow and Scanner work from the lexer's line list.
+    """
+    from kubecuro.healing.pipeline import HealingPipeline
+    pipeline = HealingPipeline({})
+    context = pipeline.run("# top\nkind: Pod\nmetadata:  # inline\n  name: web\n\n")
+    assert context.lines == context.raw_text.splitlines() + [""]
+    assert _as_tuples(pipeline.scanner.scan(context.raw_text, lines=context.lines)) == \
+        _as_tuples(pipeline.scanner.scan(context.raw_text))
+    assert context.kind == "Pod" and pipeline.shadow.get_metadata(3).inline_comment == "# inline"
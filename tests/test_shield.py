@@ -0,0 +1,32 @@
+from ruamel.yaml.comments import CommentedMap
+from kubecuro.rules.shield import ShieldEngine
+
+def _deployment():
+    container = CommentedMap({"name": "web", "image": "nginx"})
+    return CommentedMap({"kind": "Deployment", "metadata": CommentedMap({"name": "web"}),
+                         "spec": {"template": {"spec": {"containers": [container]}}}})
+
+def test_protect_runs_rules_registered_at_any_time():
+    """
+    SHIELD DISPATCH TEST: A rule added after the first protect still runs; built-ins skip kinds they do not cover.
+    """
+    shield = ShieldEngine()
+    config_map = CommentedMap({"kind": "ConfigMap", "metadata": CommentedMap({"name": "cfg"})})
+    assert shield.protect(config_map)[0]["metadata"] == {"name": "cfg", "namespace": "default"}
+
+    shield.active_rules.append(lambda doc: (doc, f"Checked {doc['kind']}"))
+    assert shield.protect(config_map) == (config_map, ["Checked ConfigMap"])
+
+def test_protect_applies_namespace_and_limits():
+    """
+    SHIELD TEST: Workloads get a namespace and default limits; cluster kinds are untouched.
+    """
+    shield = ShieldEngine(cpu_limit="200m", mem_limit="256Mi")
+    doc, logs = shield.protect(_deployment())
+    assert doc["metadata"]["namespace"] == "default"
+    assert doc["spec"]["template"]["spec"]["containers"][0]["resources"]["limits"] == {"cpu": "200m", "memory": "256Mi"}
+    assert len(logs) == 2
+
+    namespace = CommentedMap({"kind": "Namespace", "metadata": CommentedMap({"name": "team"})})
+    assert shield.protect(namespace) == (namespace, [])
+    assert "namespace" not in namespace["metadata"]
@@ -0,0 +1,40 @@
+from kubecuro.validator.validator import KubeValidator
+
+CATALOG = {
+    "Pod": {"fields": {
+        "apiVersion": {"type": "string"},
+        "kind": {"type": "string"},
+        "metadata": {"type": "object", "fields": {"name": {"type": "string"}}},
+        "spec": {"type": "object", "required": ["containers"], "fields": {
+            "containers": {"type": "array", "items": {"required": ["name"], "fields": {"name": {"type": "string"}}}},
+        }},
+    }},
+}
+
+def _pod(spec):
+    return {"apiVersion": "v1", "kind": "Pod", "metadata": {"name": "web"}, "spec": spec}
+
+def test_schema_is_compiled_once_per_kind():
+    """
+    VALIDATOR CACHE TEST: Every Pod after the first reuses the compiled schema.
+    """
+    validator = KubeValidator(CATALOG)
+    assert validator.validate_reconstruction(_pod({"containers": [{"name": "a"}]}))[0]
+    compiled = validator._compiled["Pod"]
+    assert validator.validate_reconstruction(_pod({"containers": [{"name": "b"}]}))[0]
+    assert validator._compiled["Pod"] is compiled
+
+def test_compiled_schema_reports_the_same_errors():
+    """
+    VALIDATOR TEST: Required, type and strict-mode failures name the offending path.
+    """
+    validator = KubeValidator(CATALOG)
+    assert validator.validate_reconstruction(_pod({})) == (
+        False, "Structural Error: Field 'spec.containers' is required but missing.")
+    assert validator.validate_reconstruction(_pod({"containers": {}})) == (
+        False, "Logic Error: 'spec.containers' must be a list/sequence.")
+    assert validator.validate_reconstruction(_pod({"containers": [{}]})) == (
+        False, "Structural Error: Field 'spec.containers[0].name' is required but missing.")
+    assert validator.validate_reconstruction(_pod({"containers": [{"name": "a"}], "typo": 1}), strict=True) == (
+        False, "Strict Mode Violation: Unknown field 'spec.typo'. Possible typo?")
+    assert validator.validate_reconstruction(_pod({"containers": [{"name": "a"}], "typo": 1}))[0]